@@ -19,6 +19,7 @@ if TYPE_CHECKING:
     from scripts.dev_cli import CLIRunner
 
 ALEMBIC_CONFIG = "config/alembic.ini"
+ALEMBIC_CMD = ("alembic", "-c", ALEMBIC_CONFIG)
 DEFAULT_SERVICE_NAME = "bedlam-connect-dev"
 DEFAULT_ROUNDTRIP_SCRATCH = "/tmp/bedlam-migrate-roundtrip.db"
 
@@ -44,7 +45,7 @@ def run_alembic(
         from dotenv import load_dotenv
 
         load_dotenv()
-    cmd = ["alembic", "-c", ALEMBIC_CONFIG, *args]
+    cmd = [*ALEMBIC_CMD, *args]
     if mode == "compose":
         cmd = runner.wrap_for_compose(service_name, cmd)
     return runner.run_command(cmd)
@@ -68,20 +69,23 @@ def _db_is_at_head() -> bool:
                 return stripped.split()[0]
         return ""
 
-    current = subprocess.run(
-        ["alembic", "-c", ALEMBIC_CONFIG, "current"],
-        capture_output=True,
-        text=True,
-    )
-    heads = subprocess.run(
-        ["alembic", "-c", ALEMBIC_CONFIG, "heads"],
-        capture_output=True,
-        text=True,
+    # The two queries are independent and each pays a full alembic startup,
+    # so run them side by side. Only stdout is read; stderr is discarded.
+    current, heads = (
+        subprocess.Popen(
+            [*ALEMBIC_CMD, query],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+        )
+        for query in ("current", "heads")
     )
+    current_stdout, _ = current.communicate()
+    heads_stdout, _ = heads.communicate()
     if current.returncode != 0 or heads.returncode != 0:
         return False
-    current_token = _first_token(current.stdout)
-    heads_token = _first_token(heads.stdout)
+    current_token = _first_token(current_stdout)
+    heads_token = _first_token(heads_stdout)
     if not current_token or not heads_token:
         return False
     return current_token == heads_token
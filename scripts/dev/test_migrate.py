@@ -7,7 +7,9 @@ the first `test_*.py` under `scripts/`; pytest discovers them via the
 
 from __future__ import annotations
 
+import hashlib
 import os
+import shutil
 import sqlite3
 import subprocess
 from pathlib import Path
@@ -34,6 +36,57 @@ def temp_db(tmp_path, monkeypatch) -> Path:
     return db
 
 
+def _migrations_digest() -> str:
+    """Hash of everything `alembic upgrade head` reads to build the schema."""
+    digest = hashlib.sha256()
+    sources = [PROJECT_ROOT / "alembic" / "env.py", *sorted(VERSIONS_DIR.glob("*.py"))]
+    for path in sources:
+        digest.update(path.name.encode())
+        digest.update(path.read_bytes())
+    return digest.hexdigest()[:16]
+
+
+@pytest.fixture(scope="session")
+def migrated_template_db(request, tmp_path_factory) -> Path:
+    """A sqlite DB upgraded to head, reused until the migrations change.
+
+    Tests that only need an at-head DB as a precondition copy this file
+    instead of paying for a full `alembic upgrade head` each. The template
+    is kept in pytest's cache dir keyed on the migration sources, so local
+    re-runs skip the upgrade entirely; `pytest --cache-clear` rebuilds it.
+    """
+    cache = getattr(request.config, "cache", None)
+    if cache is None:  # -p no:cacheprovider
+        cache_dir = tmp_path_factory.mktemp("migrated")
+    else:
+        cache_dir = cache.mkdir("migrated-template")
+    template = cache_dir / f"template-{_migrations_digest()}.db"
+    if template.exists():
+        return template
+
+    building = tmp_path_factory.mktemp("migrated") / "template.db"
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("DATABASE_URL", f"sqlite:///{building}")
+        assert migrate.up(CLIRunner()) == 0
+    # Another run may publish (or prune) concurrently: never remove the
+    # current digest's template, and tolerate files that are already gone.
+    for stale in cache_dir.glob("template-*.db"):
+        if stale.name != template.name:
+            stale.unlink(missing_ok=True)
+    # Copy then rename so a concurrent run never sees a half-written file.
+    staged = cache_dir / f"{template.name}.{os.getpid()}.tmp"
+    shutil.copyfile(building, staged)
+    os.replace(staged, template)
+    return template
+
+
+@pytest.fixture
+def migrated_db(temp_db: Path, migrated_template_db: Path) -> Path:
+    """`temp_db`, already at head (copied from the session template)."""
+    shutil.copyfile(migrated_template_db, temp_db)
+    return temp_db
+
+
 @pytest.fixture(autouse=True)
 def clean_new_revision_files():
     """Remove any new files autogenerated under alembic/versions during a test.
@@ -107,10 +160,7 @@ def test_down_multi_step(runner: CLIRunner, temp_db: Path):
     assert after != head
 
 
-def test_generate_creates_revision_file(runner: CLIRunner, temp_db: Path):
-    # Autogenerate refuses unless the DB is already at head.
-    assert migrate.up(runner) == 0
-
+def test_generate_creates_revision_file(runner: CLIRunner, migrated_db: Path):
     before = {p.name for p in VERSIONS_DIR.iterdir() if p.is_file()}
     rc = migrate.generate(runner, "test_step_b_revision")
     assert rc == 0
@@ -134,9 +184,7 @@ def test_generate_hints_when_db_behind_head(runner: CLIRunner, temp_db: Path, ca
     ), f"no new revision file should be created, got {after - before}"
 
 
-def test_generate_succeeds_when_db_at_head(runner: CLIRunner, temp_db: Path):
-    assert migrate.up(runner) == 0
-
+def test_generate_succeeds_when_db_at_head(runner: CLIRunner, migrated_db: Path):
     before = {p.name for p in VERSIONS_DIR.iterdir() if p.is_file()}
     rc = migrate.generate(runner, "at_head_succeeds")
     assert rc == 0
@@ -146,10 +194,9 @@ def test_generate_succeeds_when_db_at_head(runner: CLIRunner, temp_db: Path):
     assert "at_head_succeeds" in next(iter(new_files))
 
 
-def test_post_write_hooks_format_generated_revision(runner: CLIRunner, temp_db: Path):
-    # Autogenerate requires the DB to be at head before running.
-    assert migrate.up(runner) == 0
-
+def test_post_write_hooks_format_generated_revision(
+    runner: CLIRunner, migrated_db: Path
+):
     before = {p.name for p in VERSIONS_DIR.iterdir() if p.is_file()}
     rc = migrate.generate(runner, "test_post_write_hooks_step_c")
     assert rc == 0
@@ -13,16 +13,98 @@ python scripts/dev/title_case_check.py templates/         # Check specific direc
 """
 
 import argparse
+import os
 import re
 import sys
 from pathlib import Path
-from typing import Dict, List, Union
+from typing import Dict, List, Tuple, Union
 
 try:
     import pathspec
 except ImportError:
     pathspec = None
 
+# Compiled once at import; the per-line and per-title paths below call these
+# directly instead of going through `re`'s pattern cache on every call.
+_HTML_TAG_RE = re.compile(r"<[^>]+>")
+_WORD_CLEAN_RE = re.compile(r"[^\w]")
+# `_WORD_CLEAN_RE` as a translate table, for the common all-ASCII word
+_ASCII_NON_WORD_TABLE = str.maketrans(
+    "", "", "".join(c for c in map(chr, range(128)) if not (c.isalnum() or c == "_"))
+)
+_CSS_LINE_RE = re.compile(r"^\s*[a-z-]+\s*:\s*[^;]+;?\s*$")
+_JINJA_COMMENT_LINE_RE = re.compile(r"^\s*{#.*#}\s*$")
+_SECTION_NUMBER_RE = re.compile(r"^(Chapter|Section|Part|Book)\s+\d+$", re.IGNORECASE)
+_STEP_NUMBER_RE = re.compile(r"^Step\s+\d+$", re.IGNORECASE)
+# Emoji regex pattern - matches most common emoji ranges (Misc Symbols and
+# Dingbats, then the supplementary emoji and pictograph blocks). Nothing below
+# _EMOJI_RANGE_START can match, which remove_leading_emojis uses as a fast path.
+_EMOJI_RANGE_START = 0x2600
+_LEADING_EMOJI_RE = re.compile(
+    r"^[\u2600-\u27BF\U0001F000-\U0001F64F\U0001F680-\U0001FAFF]+\s*"
+)
+
+
+# The checker each worker process scans with; set by _init_worker.
+_worker_checker = None
+
+
+def _init_worker(checker_class: type) -> None:
+    global _worker_checker
+    # Files reaching a worker already passed the ignore checks in the parent
+    _worker_checker = checker_class(respect_gitignore=False)
+
+
+def _scan_in_worker(file_path: Path) -> List[Dict]:
+    return _worker_checker._scan_file(file_path)
+
+
+def _swap_word_core(word: str, core: str, replacement: str) -> str:
+    """Return `word` with `core`, its word characters, swapped for `replacement`.
+
+    Only a word whose word characters are contiguous ("(API)", "Hello,")
+    contains its core; others ("don't") are left as they are.
+    """
+    if not core or core == replacement:
+        return word
+    if len(core) == len(word):
+        return replacement
+    start = word.find(core)
+    if start == -1:
+        return word
+    return word[:start] + replacement + word[start + len(core) :]
+
+
+# Jinja delimiters: any opener followed somewhere later by its closer
+_JINJA_DELIMITERS = (("{%", "%}"), ("{{", "}}"), ("{#", "#}"))
+
+
+def _has_jinja_syntax(text: str) -> bool:
+    """Whether `text` holds a `{% %}`, `{{ }}` or `{# #}` pair, by substring search."""
+    for opener, closer in _JINJA_DELIMITERS:
+        start = text.find(opener)
+        if start != -1 and text.find(closer, start + 2) != -1:
+            return True
+    return False
+
+
+def _fuse_patterns(patterns: List[str]) -> "re.Pattern[str]":
+    """Combine patterns into one alternation that matches wherever any does.
+
+    Backreferences are renumbered so each branch still refers to its own
+    groups. Used as a single-pass prefilter: only lines it matches are run
+    through the individual patterns, which keeps their overlapping matches.
+    """
+    branches = []
+    offset = 0
+    for pattern in patterns:
+        renumbered = re.sub(
+            r"\\(\d)", lambda m: f"\\{int(m.group(1)) + offset}", pattern
+        )
+        branches.append(f"(?:{renumbered})")
+        offset += re.compile(pattern).groups
+    return re.compile("|".join(branches), re.IGNORECASE | re.DOTALL)
+
 
 class TitleCaseChecker:
     """Check and optionally fix title case violations."""
@@ -68,6 +150,27 @@ class TitleCaseChecker:
         ".jinja2": "jinja",
     }
 
+    # Build/cache directories the directory walk never descends into
+    SKIP_DIRS = frozenset(
+        {
+            "__pycache__",
+            "node_modules",
+            ".pytest_cache",
+            ".mypy_cache",
+            ".tox",
+            "venv",
+            ".venv",
+            "env",
+            ".env",
+            "build",
+            "dist",
+            ".coverage",
+            # Runtime artifacts (sqlite DBs, fixtures), not source files; see
+            # _is_in_data_dir for the single-file equivalent.
+            "data",
+        }
+    )
+
     # Binary file extensions to silently skip without attempting to read
     BINARY_EXTENSIONS = {
         ".db",
@@ -114,6 +217,8 @@ class TitleCaseChecker:
         "TypeScript",
         "Pact",  # Contract testing framework
     }
+    # Upper-cased lookup into ALWAYS_CAPITALIZE, built once for the class
+    CAPITALIZE_MAP = {word.upper(): word for word in ALWAYS_CAPITALIZE}
 
     # HTTP methods are ambiguous: they overlap with common English words
     # ("post", "get", "put", "delete", "head", "options", "patch", "trace",
@@ -141,12 +246,41 @@ class TitleCaseChecker:
         r"# title-case-ignore",  # Markdown comment
     ]
 
+    COMPILED_PATTERNS = {
+        file_type: [
+            (re.compile(pattern, re.IGNORECASE | re.DOTALL), pattern_type)
+            for pattern, pattern_type in patterns
+        ]
+        for file_type, patterns in PATTERNS.items()
+    }
+    ANY_PATTERN = {
+        file_type: _fuse_patterns([pattern for pattern, _ in patterns])
+        for file_type, patterns in PATTERNS.items()
+    }
+
+    # Characters every pattern of a file type needs somewhere in the line.
+    # A line containing none of them can't match, so it skips the regexes.
+    TRIGGER_CHARS = {
+        "markdown": ("#", "<"),
+        "html": ("<", ":"),
+        "jinja": ("<", "{", ":"),
+    }
+
+    # Below this many files, starting a process pool costs more than it saves
+    PARALLEL_MIN_FILES = 500
+
+    # Tags that open or close the style/script blocks check_file skips
+    BLOCK_TAGS = ("<style", "</style>", "<script", "</script>")
+
     def __init__(self, fix_mode: bool = False, respect_gitignore: bool = True):
         self.fix_mode = fix_mode
         self.respect_gitignore = respect_gitignore
         self.violations: List[Dict] = []
         self.gitignore_spec = None
         self.git_root = None
+        self._titleignore_cache: Dict[Path, Tuple[str, ...]] = {}
+        self._gitignore_cache: Dict[Path, object] = {}
+        self._sentence_case_cache: Dict[str, str] = {}
 
         if self.respect_gitignore:
             self._load_gitignore()
@@ -176,85 +310,153 @@ class TitleCaseChecker:
             return
 
         self.git_root = self._find_git_root()
-        gitignore_path = self.git_root / ".gitignore"
-
-        if not gitignore_path.exists():
-            return
+        self._git_root_prefix = os.path.join(self.git_root, "")
+        self.gitignore_spec = self._gitignore_spec(self.git_root)
 
+    def _gitignore_spec(self, directory: Path):
+        """Return the PathSpec for `directory/.gitignore` (None if absent), parsed once."""
         try:
-            with open(gitignore_path, "r", encoding="utf-8") as f:
-                gitignore_content = f.read()
+            return self._gitignore_cache[directory]
+        except KeyError:
+            pass
 
-            self.gitignore_spec = pathspec.PathSpec.from_lines(
-                "gitwildmatch", gitignore_content.splitlines()
-            )
-        except Exception as e:
-            print(f"Warning: Could not load .gitignore: {e}", file=sys.stderr)
+        spec = None
+        gitignore_path = directory / ".gitignore"
+        if gitignore_path.exists():
+            try:
+                with open(gitignore_path, "r", encoding="utf-8") as f:
+                    gitignore_content = f.read()
+
+                spec = pathspec.PathSpec.from_lines(
+                    "gitwildmatch", gitignore_content.splitlines()
+                )
+            except Exception as e:
+                print(f"Warning: Could not load {gitignore_path}: {e}", file=sys.stderr)
+        self._gitignore_cache[directory] = spec
+        return spec
+
+    def _gitignore_specs_for(self, relative_dir: Tuple[str, ...]) -> List[Tuple]:
+        """The `(depth, spec)` pairs of every .gitignore from the git root down
+        to `relative_dir` (a path relative to the root, as a tuple of parts)."""
+        specs = []
+        for depth in range(len(relative_dir) + 1):
+            spec = self._gitignore_spec(self.git_root.joinpath(*relative_dir[:depth]))
+            if spec is not None:
+                specs.append((depth, spec))
+        return specs
+
+    @staticmethod
+    def _matches_gitignore(specs: List[Tuple], relative_parts: Tuple[str, ...]) -> bool:
+        """Whether any .gitignore in `specs` matches the file at `relative_parts`.
+
+        Each spec sees the path relative to its own directory, as git does.
+        A negation in a deeper .gitignore does not override a shallower match.
+        """
+        for depth, spec in specs:
+            if spec.match_file("/".join(relative_parts[depth:])):
+                return True
+        return False
 
     def _is_gitignored(self, file_path: Path) -> bool:
-        """Check if a file is ignored by gitignore."""
-        if (
-            not self.respect_gitignore
-            or self.gitignore_spec is None
-            or self.git_root is None
-        ):
+        """Check if a file is ignored by the .gitignore files above it."""
+        if not self.respect_gitignore or self.git_root is None:
+            return False
+
+        relative_parts = self._relative_to_git_root(file_path)
+        if relative_parts is None:
+            # File is outside git repository
             return False
+        specs = self._gitignore_specs_for(relative_parts[:-1])
+        return self._matches_gitignore(specs, relative_parts)
 
+    def _relative_to_git_root(self, path: Path):
+        """`path`'s parts relative to the git root, or None if it lies outside.
+
+        The absolute path is sliced against the root as a string; only paths
+        that don't start with the root (e.g. reached through a symlink) are
+        resolved.
+        """
+        path_str = os.path.abspath(path)
+        if path_str.startswith(self._git_root_prefix):
+            return tuple(path_str[len(self._git_root_prefix) :].split(os.sep))
+        if path_str == self._git_root_prefix[:-1]:
+            return ()
         try:
-            # Get relative path from git root
-            relative_path = file_path.resolve().relative_to(self.git_root)
-            return self.gitignore_spec.match_file(str(relative_path))
+            return path.resolve().relative_to(self.git_root).parts
         except (ValueError, OSError):
-            # File is outside git repository or other error
-            return False
+            return None
 
     def should_ignore_line(self, line: str) -> bool:
         """Check if a line should be ignored based on exception patterns."""
-        for pattern in self.IGNORE_PATTERNS:
-            if re.search(pattern, line, re.IGNORECASE):
-                return True
+        # Every IGNORE_PATTERNS entry contains this phrase, so one
+        # case-insensitive substring test covers them all.
+        if "title-case-ignore" in line.lower():
+            return True
+
+        # Both remaining checks need one of these; most lines have neither.
+        if ":" not in line and "{#" not in line:
+            return False
 
         # Ignore lines that are inside CSS style blocks
-        if re.search(r"^\s*[a-z-]+\s*:\s*[^;]+;?\s*$", line.strip()):
+        if _CSS_LINE_RE.search(line.strip()):
             return True
 
         # Ignore lines that are Jinja comments
-        if re.search(r"^\s*{#.*#}\s*$", line.strip()):
+        if _JINJA_COMMENT_LINE_RE.search(line.strip()):
             return True
 
         return False
 
     def should_ignore_file(self, file_path: Path) -> bool:
         """Check if entire file should be ignored based on .titleignore file or gitignore."""
-        # Skip known binary extensions silently — these are never text content
-        # we'd want to title-case-check, and reading them produces utf-8 noise.
-        if file_path.suffix.lower() in self.BINARY_EXTENSIONS:
-            return True
+        return (
+            self._is_gitignored(file_path)
+            or self._is_in_data_dir(file_path)
+            or self._is_excluded(file_path)
+        )
 
-        # Skip anything under a top-level data/ directory — these are runtime
+    def _is_in_data_dir(self, file_path: Path) -> bool:
+        """Whether the path is or sits under a data/ directory (the walk prunes those)."""
+        # Skip anything under a data/ directory — these are runtime
         # artifacts (sqlite DBs, fixtures), not source files.
         try:
             parts = file_path.resolve().parts
         except OSError:
             parts = file_path.parts
-        if "data" in parts:
-            return True
+        return "data" in parts
 
-        # Check gitignore first
-        if self._is_gitignored(file_path):
+    def _is_excluded(self, file_path: Path) -> bool:
+        """The per-file half of `should_ignore_file`: binary extensions and .titleignore."""
+        # Skip known binary extensions silently — these are never text content
+        # we'd want to title-case-check, and reading them produces utf-8 noise.
+        if file_path.suffix.lower() in self.BINARY_EXTENSIONS:
             return True
 
         # Check .titleignore file
-        ignore_file = file_path.parent / ".titleignore"
-        if ignore_file.exists():
-            patterns = ignore_file.read_text().strip().split("\n")
-            for pattern in patterns:
-                pattern = pattern.strip()
-                if pattern and not pattern.startswith("#"):
-                    if file_path.match(pattern) or str(file_path).endswith(pattern):
-                        return True
+        for pattern in self._titleignore_patterns(file_path.parent):
+            if file_path.match(pattern) or str(file_path).endswith(pattern):
+                return True
         return False
 
+    def _titleignore_patterns(self, directory: Path) -> Tuple[str, ...]:
+        """Return the patterns from `directory/.titleignore`, read once per directory."""
+        try:
+            return self._titleignore_cache[directory]
+        except KeyError:
+            pass
+
+        patterns: Tuple[str, ...] = ()
+        ignore_file = directory / ".titleignore"
+        if ignore_file.exists():
+            lines = ignore_file.read_text().strip().split("\n")
+            patterns = tuple(
+                line.strip()
+                for line in lines
+                if line.strip() and not line.strip().startswith("#")
+            )
+        self._titleignore_cache[directory] = patterns
+        return patterns
+
     def is_colon_pattern(self, text: str) -> bool:
         """Check if text follows patterns that should be exempt from sentence case rules.
 
@@ -265,7 +467,7 @@ class TitleCaseChecker:
         - But NOT simple field labels like "Name:", "Last Activity:", etc.
         """
         # Remove HTML tags for checking
-        clean_text = re.sub(r"<[^>]+>", "", text).strip()
+        clean_text = _HTML_TAG_RE.sub("", text).strip()
 
         # Check if it contains a colon or dash with text on both sides
         for separator in [":", " - "]:
@@ -284,36 +486,44 @@ class TitleCaseChecker:
                             return True
 
                         # Also exempt if the before part looks like a chapter/section number
-                        if re.match(
-                            r"^(Chapter|Section|Part|Book)\s+\d+$",
-                            before_sep,
-                            re.IGNORECASE,
-                        ):
+                        if _SECTION_NUMBER_RE.match(before_sep):
                             return True
 
                         # Exempt step-by-step instruction patterns like "Step 1: Consumer test"
-                        if re.match(r"^Step\s+\d+$", before_sep, re.IGNORECASE):
+                        if _STEP_NUMBER_RE.match(before_sep):
                             return True
 
         return False
 
     def remove_leading_emojis(self, text: str) -> str:
         """Remove leading emojis from text for sentence case checking."""
-        # Emoji regex pattern - matches most common emoji ranges
-        emoji_pattern = r"^[\U0001F600-\U0001F64F\U0001F300-\U0001F5FF\U0001F680-\U0001F6FF\U0001F1E0-\U0001F1FF\U00002600-\U000027BF\U0001F900-\U0001F9FF\U0001F018-\U0001F270\U0001F000-\U0001F02F\U0001F0A0-\U0001F0FF\U0001F100-\U0001F64F\U0001F170-\U0001F251\U0001F300-\U0001F5FF\U0001F600-\U0001F64F\U0001F680-\U0001F6FF\U0001F700-\U0001F77F\U0001F780-\U0001F7FF\U0001F800-\U0001F8FF\U0001F900-\U0001F9FF\U0001FA00-\U0001FA6F\U0001FA70-\U0001FAFF\U00002600-\U000027BF\U0001F018-\U0001F270\U0001F000-\U0001F02F\U0001F0A0-\U0001F0FF\U0001F100-\U0001F64F\U0001F170-\U0001F251]+\s*"
-
+        # Titles almost always start with ASCII, which can't be an emoji
+        if not text or ord(text[0]) < _EMOJI_RANGE_START:
+            return text
         # Remove leading emojis and whitespace
-        cleaned = re.sub(emoji_pattern, "", text)
-        return cleaned
+        return _LEADING_EMOJI_RE.sub("", text)
 
     def convert_to_sentence_case(self, text: str) -> str:
-        """Convert text to sentence case, preserving proper nouns and acronyms."""
+        """Convert text to sentence case, preserving proper nouns and acronyms.
+
+        Results are cached per checker: the same titles ("Home", "Name:")
+        recur across many templates.
+        """
+        try:
+            return self._sentence_case_cache[text]
+        except KeyError:
+            pass
+        result = self._convert_to_sentence_case(text)
+        self._sentence_case_cache[text] = result
+        return result
+
+    def _convert_to_sentence_case(self, text: str) -> str:
         # Check if this is a colon pattern that should be exempt
         if self.is_colon_pattern(text):
             return text
 
         # Remove HTML tags for processing
-        clean_text = re.sub(r"<[^>]+>", "", text).strip()
+        clean_text = _HTML_TAG_RE.sub("", text).strip()
 
         # If empty after cleaning, return original
         if not clean_text:
@@ -324,9 +534,6 @@ class TitleCaseChecker:
         clean_text_no_emoji = self.remove_leading_emojis(clean_text)
         emoji_prefix = original_clean[: len(original_clean) - len(clean_text_no_emoji)]
 
-        # Create a lookup map for proper capitalization
-        capitalize_map = {word.upper(): word for word in self.ALWAYS_CAPITALIZE}
-
         words = clean_text_no_emoji.split()
         if not words:
             return text
@@ -334,36 +541,44 @@ class TitleCaseChecker:
         result_words = []
         for i, word in enumerate(words):
             # Remove punctuation for checking
-            clean_word = re.sub(r"[^\w]", "", word)
+            if word.isascii():
+                clean_word = word.translate(_ASCII_NON_WORD_TABLE)
+            else:
+                clean_word = _WORD_CLEAN_RE.sub("", word)
+            upper_word = clean_word.upper()
 
             # HTTP methods: preserve when source is uppercase (doc style),
             # otherwise treat as a regular English word.
-            is_http_method = clean_word.upper() in self.HTTP_METHODS
+            is_http_method = upper_word in self.HTTP_METHODS
             if is_http_method and clean_word.isupper():
                 result_words.append(word)
                 continue
 
             if i == 0:
                 # First word: capitalize first letter only, unless it's a special word
-                if not is_http_method and clean_word.upper() in capitalize_map:
-                    proper_case = capitalize_map[clean_word.upper()]
-                    result_words.append(word.replace(clean_word, proper_case))
+                if not is_http_method and upper_word in self.CAPITALIZE_MAP:
+                    proper_case = self.CAPITALIZE_MAP[upper_word]
+                    result_words.append(_swap_word_core(word, clean_word, proper_case))
                 else:
                     # Capitalize only first letter
                     if clean_word:
-                        new_word = word.replace(
-                            clean_word, clean_word[0].upper() + clean_word[1:].lower()
+                        new_word = _swap_word_core(
+                            word,
+                            clean_word,
+                            clean_word[0].upper() + clean_word[1:].lower(),
                         )
                         result_words.append(new_word)
                     else:
                         result_words.append(word)
             else:
                 # Other words: only capitalize if in ALWAYS_CAPITALIZE
-                if not is_http_method and clean_word.upper() in capitalize_map:
-                    proper_case = capitalize_map[clean_word.upper()]
-                    result_words.append(word.replace(clean_word, proper_case))
+                if not is_http_method and upper_word in self.CAPITALIZE_MAP:
+                    proper_case = self.CAPITALIZE_MAP[upper_word]
+                    result_words.append(_swap_word_core(word, clean_word, proper_case))
                 else:
-                    result_words.append(word.replace(clean_word, clean_word.lower()))
+                    result_words.append(
+                        _swap_word_core(word, clean_word, clean_word.lower())
+                    )
 
         sentence_case = emoji_prefix + " ".join(result_words)
 
@@ -376,21 +591,39 @@ class TitleCaseChecker:
 
     def is_sentence_case(self, text: str) -> bool:
         """Check if text follows sentence case rules."""
+        if self._is_plain_sentence_case(text):
+            return True
         expected = self.convert_to_sentence_case(text)
         return text == expected
 
+    def _is_plain_sentence_case(self, text: str) -> bool:
+        """Cheap check for the common already-correct title ("Create a new post").
+
+        True only for plain ASCII words separated by single spaces that
+        convert_to_sentence_case would leave untouched. False means "not
+        sure", not "violation".
+        """
+        if not text.isascii():
+            return False
+        words = text.split(" ")
+        first = words[0]
+        if not first.isalnum() or first[0] != first[0].upper():
+            return False
+        if first[1:] != first[1:].lower():
+            return False
+        upper_first = first.upper()
+        if upper_first in self.CAPITALIZE_MAP or upper_first in self.HTTP_METHODS:
+            return False
+        for word in words[1:]:
+            if not word.isalnum() or word != word.lower():
+                return False
+            if word.upper() in self.CAPITALIZE_MAP:
+                return False
+        return True
+
     def _detect_jinja_syntax(self, content: str) -> bool:
         """Detect if content contains Jinja template syntax."""
-        jinja_patterns = [
-            r"{%.*?%}",  # Jinja blocks like {% block %}, {% for %}, etc.
-            r"{{.*?}}",  # Jinja variables like {{ variable }}
-            r"{#.*?#}",  # Jinja comments like {# comment #}
-        ]
-
-        for pattern in jinja_patterns:
-            if re.search(pattern, content, re.DOTALL):
-                return True
-        return False
+        return _has_jinja_syntax(content)
 
     def _get_file_type(self, file_path: Path, content: str = None) -> str:
         """Determine the file type, with special handling for HTML files that contain Jinja syntax."""
@@ -419,9 +652,18 @@ class TitleCaseChecker:
 
     def check_file(self, file_path: Path) -> List[Dict]:
         """Check a single file for title case violations."""
+        # Unsupported extensions are decided from the name alone — no ignore
+        # lookups, no read.
+        if file_path.suffix.lower() not in self.FILE_EXTENSIONS:
+            return []
+
         if self.should_ignore_file(file_path):
             return []
 
+        return self._scan_file(file_path)
+
+    def _scan_file(self, file_path: Path) -> List[Dict]:
+        """Read and scan a file that has already passed the extension and ignore checks."""
         try:
             content = file_path.read_text(encoding="utf-8")
         except (UnicodeDecodeError, OSError):
@@ -432,13 +674,24 @@ class TitleCaseChecker:
         if file_type is None:
             return []
 
-        patterns = self.PATTERNS[file_type]
+        patterns = self.COMPILED_PATTERNS[file_type]
+        any_pattern = self.ANY_PATTERN[file_type]
+        trigger_chars = self.TRIGGER_CHARS[file_type]
         violations = []
 
+        # No line can match without a trigger character, so a file with none
+        # is never split into lines at all.
+        if not any(char in content for char in trigger_chars):
+            return violations
+
         lines = content.split("\n")
         in_style_block = False
         in_script_block = False
         in_fenced_code_block = False
+        # Files without any style/script tag (most Markdown) skip the block
+        # tracking below altogether; the rest only lower-case lines with a "<".
+        content_lower = content.lower()
+        track_blocks = any(tag in content_lower for tag in self.BLOCK_TAGS)
 
         for line_num, line in enumerate(lines, 1):
             # Track Markdown fenced code blocks (``` or ~~~). Anything inside
@@ -455,27 +708,35 @@ class TitleCaseChecker:
                 continue
 
             # Track context
-            if "<style" in line.lower():
-                in_style_block = True
-            elif "</style>" in line.lower():
-                in_style_block = False
-                continue  # Skip the closing style tag line
-            elif "<script" in line.lower():
-                in_script_block = True
-            elif "</script>" in line.lower():
-                in_script_block = False
-                continue  # Skip the closing script tag line
+            if track_blocks and "<" in line:
+                line_lower = line.lower()
+                if "<style" in line_lower:
+                    in_style_block = True
+                elif "</style>" in line_lower:
+                    in_style_block = False
+                    continue  # Skip the closing style tag line
+                elif "<script" in line_lower:
+                    in_script_block = True
+                elif "</script>" in line_lower:
+                    in_script_block = False
+                    continue  # Skip the closing script tag line
 
             # Skip lines in style or script blocks
             if in_style_block or in_script_block:
                 continue
 
+            # One pass over the line with the fused alternation; most lines
+            # match nothing and never reach the per-pattern scans below.
+            if not any(char in line for char in trigger_chars):
+                continue
+            if not any_pattern.search(line):
+                continue
+
             if self.should_ignore_line(line):
                 continue
 
             for pattern, pattern_type in patterns:
-                matches = re.finditer(pattern, line, re.IGNORECASE | re.DOTALL)
-                for match in matches:
+                for match in pattern.finditer(line):
                     if pattern_type == "markdown_header":
                         title_text = match.group(2).strip()
                         header_level = match.group(1)
@@ -505,12 +766,17 @@ class TitleCaseChecker:
                     else:
                         continue
 
-                    if title_text and not self.is_sentence_case(title_text):
+                    if not title_text or self._is_plain_sentence_case(title_text):
+                        continue
+                    # One (cached) conversion both decides and supplies the fix;
+                    # repeated titles hit convert_to_sentence_case's cache.
+                    suggested = self.convert_to_sentence_case(title_text)
+                    if suggested != title_text:
                         violation = {
                             "file": file_path,
                             "line": line_num,
                             "original": title_text,
-                            "suggested": self.convert_to_sentence_case(title_text),
+                            "suggested": suggested,
                             "pattern_type": pattern_type,
                             "header_level": header_level,
                             "full_line": line,
@@ -571,16 +837,7 @@ class TitleCaseChecker:
 
     def _contains_jinja_expression(self, text: str) -> bool:
         """Check if text contains Jinja template expressions."""
-        jinja_patterns = [
-            r"{%.*?%}",  # Jinja blocks like {% block %}, {% for %}, etc.
-            r"{{.*?}}",  # Jinja variables like {{ variable }}
-            r"{#.*?#}",  # Jinja comments like {# comment #}
-        ]
-
-        for pattern in jinja_patterns:
-            if re.search(pattern, text, re.DOTALL):
-                return True
-        return False
+        return _has_jinja_syntax(text)
 
     def fix_file(self, file_path: Path, violations: List[Dict]) -> bool:
         """Fix title case violations in a file."""
@@ -603,7 +860,12 @@ class TitleCaseChecker:
                         violation["original"], violation["suggested"]
                     )
 
-            file_path.write_text("\n".join(lines), encoding="utf-8")
+            fixed = "\n".join(lines)
+            if fixed == content:
+                # Nothing actually changed; leave the file (and its mtime) alone.
+                return False
+
+            file_path.write_text(fixed, encoding="utf-8")
             return True
 
         except Exception as e:
@@ -611,86 +873,127 @@ class TitleCaseChecker:
             return False
 
     def check_directory(self, directory: Path, recursive: bool = True) -> List[Dict]:
-        """Check all files in a directory, skipping hidden directories."""
-        all_violations = []
+        """Check all files in a directory, skipping hidden directories.
 
-        def should_skip_directory(dir_path: Path) -> bool:
-            """Check if a directory should be skipped entirely."""
-            # Skip hidden directories (starting with '.')
-            if dir_path.name.startswith("."):
-                return True
+        Walks with `os.scandir`, whose entries already know whether they are
+        files or directories, so no extra stat per entry. An explicit stack of
+        open directory iterators keeps the depth-first, in-directory order of
+        a recursive walk.
 
-            # Skip common build/cache directories
-            skip_dirs = {
-                "__pycache__",
-                "node_modules",
-                ".pytest_cache",
-                ".mypy_cache",
-                ".tox",
-                "venv",
-                ".venv",
-                "env",
-                ".env",
-                "build",
-                "dist",
-                ".coverage",
-            }
-            if dir_path.name in skip_dirs:
-                return True
+        Each stack entry also carries the directory's path relative to the git
+        root and the .gitignore specs in force there, so nested .gitignore
+        files are picked up on the way down and files are matched without
+        resolving their paths.
+        """
+        files = []
+        stack = []
 
-            return False
+        if self._is_in_data_dir(directory):
+            return []
 
-        def scan_directory(current_dir: Path, is_recursive: bool = True):
-            """Recursively scan directory, skipping hidden directories."""
+        root_parts = None
+        if self.respect_gitignore and self.git_root is not None:
+            # None outside the git repository — nothing is gitignored there
+            root_parts = self._relative_to_git_root(directory)
+        # Specs from the directories above the walk's root; enter() adds the
+        # root's own .gitignore like any other directory's.
+        root_specs = self._gitignore_specs_for(root_parts[:-1]) if root_parts else []
+
+        def enter(dir_path: str, rel_parts, specs) -> None:
+            if rel_parts is not None:
+                spec = self._gitignore_spec(self.git_root.joinpath(*rel_parts))
+                if spec is not None:
+                    specs = [*specs, (len(rel_parts), spec)]
             try:
-                for item in current_dir.iterdir():
-                    if item.is_file():
-                        # Check if file should be processed
-                        if not self.should_ignore_file(item):
-                            violations = self.check_file(item)
-                            all_violations.extend(violations)
-                    elif item.is_dir() and is_recursive:
-                        # Skip hidden and unwanted directories
-                        if not should_skip_directory(item):
-                            scan_directory(item, is_recursive)
+                stack.append((dir_path, os.scandir(dir_path), rel_parts, specs))
             except PermissionError:
                 # Skip directories we don't have permission to read
                 pass
             except Exception as e:
-                print(f"Warning: Error scanning {current_dir}: {e}", file=sys.stderr)
+                print(f"Warning: Error scanning {Path(dir_path)}: {e}", file=sys.stderr)
+
+        enter(os.fspath(directory), root_parts, root_specs)
+        while stack:
+            dir_path, entries, rel_parts, specs = stack[-1]
+            try:
+                entry = next(entries, None)
+                if entry is None:
+                    stack.pop()
+                    entries.close()
+                elif entry.is_file():
+                    extension = os.path.splitext(entry.name)[1].lower()
+                    if extension not in self.FILE_EXTENSIONS:
+                        continue
+                    if rel_parts is not None and self._matches_gitignore(
+                        specs, (*rel_parts, entry.name)
+                    ):
+                        continue
+                    item = Path(entry.path)
+                    # Check if file should be processed
+                    if not self._is_excluded(item):
+                        files.append(item)
+                elif entry.is_dir() and recursive:
+                    # Skip hidden and unwanted directories
+                    if not (entry.name.startswith(".") or entry.name in self.SKIP_DIRS):
+                        enter(
+                            entry.path,
+                            None if rel_parts is None else (*rel_parts, entry.name),
+                            specs,
+                        )
+            except PermissionError:
+                stack.pop()
+                entries.close()
+            except Exception as e:
+                print(f"Warning: Error scanning {Path(dir_path)}: {e}", file=sys.stderr)
+                stack.pop()
+                entries.close()
+
+        return self._scan_files(files)
+
+    def _scan_files(self, files: List[Path]) -> List[Dict]:
+        """Scan files in order, across processes when there are enough of them.
+
+        Each file is scanned independently, so large trees are split over a
+        process pool; the regex work holds the GIL, which rules out threads.
+        """
+        all_violations = []
+        if len(files) < self.PARALLEL_MIN_FILES or (os.cpu_count() or 1) < 2:
+            for file_path in files:
+                all_violations.extend(self._scan_file(file_path))
+            return all_violations
+
+        from concurrent.futures import ProcessPoolExecutor
 
-        scan_directory(directory, recursive)
+        with ProcessPoolExecutor(
+            initializer=_init_worker, initargs=(type(self),)
+        ) as executor:
+            for violations in executor.map(_scan_in_worker, files, chunksize=32):
+                all_violations.extend(violations)
         return all_violations
 
     def run(self, paths: List[Union[str, Path]]) -> int:
         """Run the checker on the given paths."""
-        all_violations = []
+        # Violations grouped by file as they come in, in first-seen order
+        by_file: Dict[Path, List[Dict]] = {}
 
         for path_str in paths:
             path = Path(path_str)
             if path.is_file():
                 violations = self.check_file(path)
-                all_violations.extend(violations)
             elif path.is_dir():
                 violations = self.check_directory(path)
-                all_violations.extend(violations)
             else:
                 print(f"Warning: {path} does not exist", file=sys.stderr)
+                continue
+            for violation in violations:
+                by_file.setdefault(violation["file"], []).append(violation)
 
-        if not all_violations:
+        if not by_file:
             print("✅ No title case violations found!")
             return 0
 
-        # Group violations by file
-        by_file = {}
-        for violation in all_violations:
-            file_path = violation["file"]
-            if file_path not in by_file:
-                by_file[file_path] = []
-            by_file[file_path].append(violation)
-
         # Report violations
-        total_violations = len(all_violations)
+        total_violations = sum(len(violations) for violations in by_file.values())
         print(
             f"❌ Found {total_violations} title case violation(s) in {len(by_file)} file(s):"
         )
@@ -6,13 +6,19 @@ This CLI provides convenient commands for common development tasks.
 """
 
 import argparse
+import functools
+import os
+import shutil
 import subprocess
 import sys
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 # Constants
 DOCKER_COMPOSE_DEV_FILE = "docker-compose.dev.yml"
+COMPOSE_DEV_CMD = ("docker", "compose", "-f", DOCKER_COMPOSE_DEV_FILE)
+# How long an interrupted child gets to exit on its own before it is killed.
+INTERRUPT_GRACE_SECONDS = 2
 ENV_TEMPLATE = """# Development environment variables
 # Copy this file to .env and customize as needed
 
@@ -30,18 +36,53 @@ DEVELOPMENT=true
 
 
 def _resolve_project_root() -> Path:
-    cwd = Path.cwd().resolve()
+    return _find_project_root(Path.cwd().resolve())
+
+
+@functools.lru_cache(maxsize=None)
+def _find_project_root(cwd: Path) -> Path:
+    """Walk up from `cwd` to the nearest `pyproject.toml`; cached per cwd."""
     for candidate in [cwd, *cwd.parents]:
         if (candidate / "pyproject.toml").is_file():
             return candidate
     return Path(__file__).resolve().parent.parent
 
 
+def _probe_version(cmd: List[str]) -> Optional[str]:
+    """Return the stripped stdout of `cmd`, or None if it fails to run."""
+    try:
+        result = subprocess.run(
+            cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True
+        )
+    except FileNotFoundError:
+        return None
+    if result.returncode != 0:
+        return None
+    return result.stdout.strip()
+
+
+@functools.lru_cache(maxsize=1)
+def _docker_installation() -> Tuple[Optional[str], Optional[str]]:
+    """Locate the docker CLI and probe compose, once per process.
+
+    Returns `(docker path, compose version)`. Each `docker` invocation can
+    take a second or more to start, so the CLI is found with a PATH lookup
+    and only `docker compose version` is spawned — it fails unless docker
+    itself works. Repeated checks (e.g. a script chaining `setup` into `up`)
+    reuse this result.
+    """
+    docker_path = shutil.which("docker")
+    if docker_path is None:
+        return None, None
+    return docker_path, _probe_version(["docker", "compose", "version"])
+
+
 class CLIRunner:
     """Handles command execution and common utilities."""
 
     def __init__(self):
         self.project_root = _resolve_project_root()
+        self.compose_file = self.project_root / DOCKER_COMPOSE_DEV_FILE
 
     def run_command(self, cmd: List[str], cwd: Optional[Path] = None) -> int:
         """Run a command and return its exit code."""
@@ -51,13 +92,74 @@ class CLIRunner:
         print(f"🚀 Running: {' '.join(cmd)}")
         print(f"📁 Working directory: {cwd}")
 
+        # Output is inherited rather than piped: the child writes straight to
+        # the terminal, so nothing sits in a pipe buffer.
         try:
-            result = subprocess.run(cmd, cwd=cwd, check=False)
-            return result.returncode
+            proc = subprocess.Popen(cmd, cwd=cwd)
+        except Exception as e:
+            print(f"❌ Error running command: {e}")
+            return 1
+
+        try:
+            return proc.wait()
         except KeyboardInterrupt:
+            # The child got the same SIGINT; give it a moment to flush and
+            # exit cleanly (e.g. alembic mid-migration) before killing it.
             print("\n⚠️ Interrupted by user")
+            try:
+                proc.wait(timeout=INTERRUPT_GRACE_SECONDS)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+                proc.wait()
             return 130
+
+    def run_captured(
+        self, cmd: List[str], cwd: Optional[Path] = None
+    ) -> Tuple[int, str]:
+        """Run a command with stdout and stderr captured together.
+
+        Returns `(exit code, output)` so callers running several commands at
+        once can print each one's output as a block instead of interleaved.
+        """
+        if cwd is None:
+            cwd = self.project_root
+
+        try:
+            result = subprocess.run(
+                cmd,
+                cwd=cwd,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                text=True,
+                check=False,
+            )
+            return result.returncode, result.stdout
+        except Exception as e:
+            return 1, f"❌ Error running command: {e}\n"
+
+    def exec_command(self, cmd: List[str], cwd: Optional[Path] = None) -> int:
+        """Replace the CLI process with `cmd`.
+
+        For leaf commands whose exit code is the CLI's exit code: no idle
+        Python parent is kept around for the lifetime of `docker compose up`
+        or `pytest`. Only returns if the exec itself fails.
+        """
+        if cwd is None:
+            cwd = self.project_root
+
+        print(f"🚀 Running: {' '.join(cmd)}")
+        print(f"📁 Working directory: {cwd}")
+        sys.stdout.flush()
+        sys.stderr.flush()
+
+        # execvp has no cwd argument, so change directory first; if the exec
+        # fails the CLI keeps running and must get its own cwd back.
+        previous_cwd = os.getcwd()
+        try:
+            os.chdir(cwd)
+            os.execvp(cmd[0], cmd)
         except Exception as e:
+            os.chdir(previous_cwd)
             print(f"❌ Error running command: {e}")
             return 1
 
@@ -65,15 +167,13 @@ class CLIRunner:
         """Check if a docker compose service has any running containers."""
         result = subprocess.run(
             [
-                "docker",
-                "compose",
-                "-f",
-                DOCKER_COMPOSE_DEV_FILE,
+                *COMPOSE_DEV_CMD,
                 "ps",
                 "-q",
                 service_name,
             ],
-            capture_output=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
             text=True,
             cwd=self.project_root,
         )
@@ -89,20 +189,14 @@ class CLIRunner:
         """
         if self.is_dev_container_running(service_name):
             return [
-                "docker",
-                "compose",
-                "-f",
-                DOCKER_COMPOSE_DEV_FILE,
+                *COMPOSE_DEV_CMD,
                 "exec",
                 service_name,
                 *container_cmd,
             ]
         print("ℹ️  Dev container not running — using one-off `docker compose run`")
         return [
-            "docker",
-            "compose",
-            "-f",
-            DOCKER_COMPOSE_DEV_FILE,
+            *COMPOSE_DEV_CMD,
             "run",
             "--rm",
             "--no-deps",
@@ -112,37 +206,20 @@ class CLIRunner:
 
     def check_docker_installation(self) -> bool:
         """Check if Docker and Docker Compose are available."""
-        # Check Docker
-        try:
-            result = subprocess.run(
-                ["docker", "--version"], capture_output=True, text=True
-            )
-            if result.returncode != 0:
-                print("❌ Docker is not installed or not accessible")
-                print(
-                    "Please install Docker Desktop: https://www.docker.com/products/docker-desktop"
-                )
-                return False
-            print(f"✅ Docker found: {result.stdout.strip()}")
-        except FileNotFoundError:
+        docker_path, compose_version = _docker_installation()
+
+        if docker_path is None:
             print("❌ Docker is not installed or not accessible")
             print(
                 "Please install Docker Desktop: https://www.docker.com/products/docker-desktop"
             )
             return False
+        print(f"✅ Docker found: {docker_path}")
 
-        # Check Docker Compose
-        try:
-            result = subprocess.run(
-                ["docker", "compose", "version"], capture_output=True, text=True
-            )
-            if result.returncode != 0:
-                print("❌ Docker Compose is not available")
-                return False
-            print(f"✅ Docker Compose found: {result.stdout.strip()}")
-        except FileNotFoundError:
+        if compose_version is None:
             print("❌ Docker Compose is not available")
             return False
+        print(f"✅ Docker Compose found: {compose_version}")
 
         return True
 
@@ -157,45 +234,45 @@ class DevCommands:
         """Start the development environment."""
         print("🛠️ Starting development environment...")
 
-        cmd = ["docker", "compose", "-f", DOCKER_COMPOSE_DEV_FILE, "up"]
+        cmd = [*COMPOSE_DEV_CMD, "up"]
         if build:
             cmd.append("--build")
         if detach:
             cmd.append("--detach")
 
-        return self.runner.run_command(cmd)
+        return self.runner.exec_command(cmd)
 
     def down(self, volumes: bool = False) -> int:
         """Stop the development environment."""
         print("🛑 Stopping development environment...")
 
-        cmd = ["docker", "compose", "-f", DOCKER_COMPOSE_DEV_FILE, "down"]
+        cmd = [*COMPOSE_DEV_CMD, "down"]
         if volumes:
             cmd.append("--volumes")
 
-        return self.runner.run_command(cmd)
+        return self.runner.exec_command(cmd)
 
     def logs(self, follow: bool = False, service: Optional[str] = None) -> int:
         """Show logs from the development environment."""
         print("📋 Showing development environment logs...")
 
-        cmd = ["docker", "compose", "-f", DOCKER_COMPOSE_DEV_FILE, "logs"]
+        cmd = [*COMPOSE_DEV_CMD, "logs"]
         if follow:
             cmd.append("--follow")
         if service:
             cmd.append(service)
 
-        return self.runner.run_command(cmd)
+        return self.runner.exec_command(cmd)
 
     def restart(self, service: Optional[str] = None) -> int:
         """Restart the development environment."""
         print("🔄 Restarting development environment...")
 
-        cmd = ["docker", "compose", "-f", DOCKER_COMPOSE_DEV_FILE, "restart"]
+        cmd = [*COMPOSE_DEV_CMD, "restart"]
         if service:
             cmd.append(service)
 
-        return self.runner.run_command(cmd)
+        return self.runner.exec_command(cmd)
 
 
 class TestCommands:
@@ -211,11 +288,18 @@ class TestCommands:
         markers: Optional[str] = None,
         keywords: Optional[str] = None,
         paths: Optional[List[str]] = None,
+        jobs: str = "auto",
     ) -> int:
-        """Run tests with specified options."""
+        """Run tests with specified options.
+
+        `jobs` is forwarded to pytest-xdist's `-n`; `"0"` runs in a single
+        process. `--dist=loadfile` keeps each test file on one worker.
+        """
         print("🧪 Running tests...")
 
         cmd = ["pytest"]
+        if jobs != "0":
+            cmd.extend(["-n", jobs, "--dist=loadfile"])
         if verbose:
             cmd.append("-v")
         if tb:
@@ -227,7 +311,7 @@ class TestCommands:
         if paths:
             cmd.extend(paths)
 
-        return self.runner.run_command(cmd)
+        return self.runner.exec_command(cmd)
 
 
 class QualityCommands:
@@ -237,7 +321,11 @@ class QualityCommands:
         self.runner = runner
 
     def lint(self) -> int:
-        """Run all linting checks."""
+        """Run all linting checks.
+
+        The checks are independent and read-only, so they run concurrently;
+        each one's output is printed afterwards in a fixed order.
+        """
         print("🔍 Running linting checks...")
 
         checks = [
@@ -252,10 +340,21 @@ class QualityCommands:
             ),
         ]
 
+        # Imported here: only `lint` needs it, and it would otherwise add to
+        # the startup of every `dev` invocation.
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=len(checks)) as pool:
+            results = list(
+                pool.map(lambda check: self.runner.run_captured(check[1]), checks)
+            )
+
         exit_code = 0
-        for description, cmd in checks:
+        for (description, cmd), (result, output) in zip(checks, results):
             print(description)
-            result = self.runner.run_command(cmd)
+            print(f"🚀 Running: {' '.join(cmd)}")
+            if output:
+                print(output, end="" if output.endswith("\n") else "\n")
             if result != 0:
                 exit_code = result
 
@@ -451,34 +550,59 @@ class SetupCommands:
     def __init__(self, runner: CLIRunner):
         self.runner = runner
 
-    def setup(self) -> int:
-        """Set up the development environment."""
+    def setup(self, prewarm: bool = False) -> int:
+        """Set up the development environment.
+
+        With `prewarm`, also builds the dev image and creates its containers
+        so the first `dev up` is a warm start.
+        """
         print("🔧 Setting up development environment...")
 
-        # Check Docker installation
-        if not self.runner.check_docker_installation():
+        # Check Docker installation. CI runners and hosts with DOCKER_HOST
+        # preconfigured already guarantee it, so skip the CLI probes there.
+        if os.environ.get("CI") or os.environ.get("DOCKER_HOST"):
+            print("⏩ Skipping Docker checks (CI/DOCKER_HOST detected)")
+        elif not self.runner.check_docker_installation():
             return 1
 
         # Check compose file
-        dev_compose_file = self.runner.project_root / DOCKER_COMPOSE_DEV_FILE
+        dev_compose_file = self.runner.compose_file
         if not dev_compose_file.exists():
             print(f"❌ Development compose file not found: {dev_compose_file}")
             return 1
         print(f"✅ Development compose file found: {dev_compose_file}")
 
-        # Create .env file if it doesn't exist
+        # Create .env file if it doesn't exist. O_EXCL makes check-and-create
+        # atomic, so concurrent setups can't clobber each other's file.
         env_file = self.runner.project_root / ".env"
-        if not env_file.exists():
+        try:
+            fd = os.open(env_file, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        except FileExistsError:
+            print(f"✅ Environment file found: {env_file}")
+        except OSError as e:
+            print(f"❌ Failed to create .env file: {e}")
+            return 1
+        else:
             print("📝 Creating .env template...")
             try:
-                env_file.write_text(ENV_TEMPLATE)
-                print(f"✅ Created .env template: {env_file}")
-                print("   Please review and customize the values as needed")
-            except Exception as e:
+                os.write(fd, ENV_TEMPLATE.encode())
+            except OSError as e:
                 print(f"❌ Failed to create .env file: {e}")
+                # Don't leave an empty/partial file that later runs would
+                # report as an existing environment file.
+                os.unlink(env_file)
                 return 1
-        else:
-            print(f"✅ Environment file found: {env_file}")
+            finally:
+                os.close(fd)
+            print(f"✅ Created .env template: {env_file}")
+            print("   Please review and customize the values as needed")
+
+        if prewarm:
+            print("🔥 Building the dev image and creating containers...")
+            result = self.runner.run_command([*COMPOSE_DEV_CMD, "create", "--build"])
+            if result != 0:
+                print("❌ Prewarm failed")
+                return result
 
         print("\n🎉 Setup complete! You can now run:")
         print("   dev up        # Start development environment")
@@ -502,8 +626,15 @@ class DevCLI:
         self.promote_admin_cmd = PromoteAdminCommands(self.runner)
         self.migrate_cmd = MigrateCommands(self.runner)
 
-    def create_parser(self) -> argparse.ArgumentParser:
-        """Create the argument parser with all commands."""
+    def create_parser(self, command: Optional[str] = None) -> argparse.ArgumentParser:
+        """Create the argument parser.
+
+        When `command` names a known subcommand, only that subparser is
+        built — the rest of the tree (help strings, nested `migrate`
+        parsers) is never constructed. Anything else (`--help`, a typo, no
+        command) gets the full tree so usage and error output list every
+        command.
+        """
         parser = argparse.ArgumentParser(
             description="Development CLI",
             formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -515,30 +646,41 @@ Examples:
   %(prog)s logs -f             # Follow development logs
   %(prog)s test -m api         # Run API tests only
   %(prog)s test --tb short     # Run tests with short traceback
+  %(prog)s test -n 0           # Run tests in a single process
   %(prog)s lint                # Run all linting checks
             """,
         )
 
         subparsers = parser.add_subparsers(dest="command", help="Available commands")
 
-        # Development commands (flattened for simplicity)
-        self._add_up_parser(subparsers)
-        self._add_down_parser(subparsers)
-        self._add_logs_parser(subparsers)
-        self._add_restart_parser(subparsers)
-
-        # Other commands
-        self._add_test_parser(subparsers)
-        self._add_lint_parser(subparsers)
-        self._add_fmt_parser(subparsers)
-        self._add_setup_parser(subparsers)
-        self._add_seed_parser(subparsers)
-        self._add_routes_parser(subparsers)
-        self._add_promote_admin_parser(subparsers)
-        self._add_migrate_parser(subparsers)
+        builders = self._subparser_builders()
+        if command in builders:
+            builders[command](subparsers)
+        else:
+            for add_parser in builders.values():
+                add_parser(subparsers)
 
         return parser
 
+    def _subparser_builders(self) -> dict:
+        """Map each command name to the method that adds its subparser."""
+        return {
+            # Development commands (flattened for simplicity)
+            "up": self._add_up_parser,
+            "down": self._add_down_parser,
+            "logs": self._add_logs_parser,
+            "restart": self._add_restart_parser,
+            # Other commands
+            "test": self._add_test_parser,
+            "lint": self._add_lint_parser,
+            "fmt": self._add_fmt_parser,
+            "setup": self._add_setup_parser,
+            "seed": self._add_seed_parser,
+            "routes": self._add_routes_parser,
+            "promote-admin": self._add_promote_admin_parser,
+            "migrate": self._add_migrate_parser,
+        }
+
     def _add_up_parser(self, subparsers):
         parser = subparsers.add_parser("up", help="Start development environment")
         parser.add_argument(
@@ -585,6 +727,12 @@ Examples:
         parser.add_argument(
             "-k", "--keywords", help="Run tests matching keyword expressions"
         )
+        parser.add_argument(
+            "-n",
+            "--jobs",
+            default="auto",
+            help="pytest-xdist worker count (default: auto; 0 runs in one process)",
+        )
         parser.add_argument(
             "paths",
             nargs="*",
@@ -592,7 +740,12 @@ Examples:
         )
         parser.set_defaults(
             func=lambda args: self.test.run_tests(
-                args.verbose, args.tb, args.markers, args.keywords, args.paths
+                args.verbose,
+                args.tb,
+                args.markers,
+                args.keywords,
+                args.paths,
+                args.jobs,
             )
         )
 
@@ -608,7 +761,12 @@ Examples:
 
     def _add_setup_parser(self, subparsers):
         parser = subparsers.add_parser("setup", help="Set up development environment")
-        parser.set_defaults(func=lambda args: self.setup.setup())
+        parser.add_argument(
+            "--prewarm",
+            action="store_true",
+            help="Build the dev image and create containers so the first `up` is warm",
+        )
+        parser.set_defaults(func=lambda args: self.setup.setup(args.prewarm))
 
     def _add_seed_parser(self, subparsers):
         parser = subparsers.add_parser(
@@ -686,10 +844,12 @@ Examples:
 
         parser.set_defaults(func=_print_help)
 
-    def run(self) -> int:
+    def run(self, argv: Optional[List[str]] = None) -> int:
         """Run the CLI application."""
-        parser = self.create_parser()
-        args = parser.parse_args()
+        if argv is None:
+            argv = sys.argv[1:]
+        parser = self.create_parser(argv[0] if argv else None)
+        args = parser.parse_args(argv)
 
         if not args.command:
             parser.print_help()
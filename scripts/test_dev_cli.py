@@ -2,9 +2,31 @@
 
 from __future__ import annotations
 
+import argparse
+import subprocess
 from pathlib import Path
 
-from scripts.dev_cli import CLIRunner
+import pytest
+
+from scripts import dev_cli
+from scripts.dev_cli import CLIRunner, DevCLI
+
+
+@pytest.fixture
+def project_root(tmp_path: Path, monkeypatch) -> Path:
+    """A fake project (pyproject + dev compose stub) that is the cwd."""
+    (tmp_path / "pyproject.toml").write_text("[project]\nname = 'fake'\n")
+    (tmp_path / dev_cli.DOCKER_COMPOSE_DEV_FILE).write_text("services: {}\n")
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+@pytest.fixture
+def fresh_docker_probe():
+    """Reset the per-process docker CLI probe around the test."""
+    dev_cli._docker_installation.cache_clear()
+    yield
+    dev_cli._docker_installation.cache_clear()
 
 
 def test_clirunner_resolves_project_root_from_cwd(tmp_path: Path, monkeypatch):
@@ -17,3 +39,203 @@ def test_clirunner_resolves_project_root_from_cwd(tmp_path: Path, monkeypatch):
 
     runner = CLIRunner()
     assert runner.project_root == subroot.resolve()
+
+
+def test_exec_command_replaces_process_in_project_root(project_root: Path, monkeypatch):
+    calls = []
+    monkeypatch.setattr(dev_cli.os, "chdir", lambda path: calls.append(("chdir", path)))
+    monkeypatch.setattr(
+        dev_cli.os, "execvp", lambda file, args: calls.append(("execvp", file, args))
+    )
+
+    CLIRunner().exec_command(["pytest", "-q"])
+
+    assert calls == [
+        ("chdir", project_root.resolve()),
+        ("execvp", "pytest", ["pytest", "-q"]),
+    ]
+
+
+def test_exec_command_returns_1_when_exec_fails(project_root: Path, monkeypatch):
+    def _missing(file, args):
+        raise FileNotFoundError(file)
+
+    monkeypatch.setattr(dev_cli.os, "execvp", _missing)
+
+    assert CLIRunner().exec_command(["no-such-binary"], cwd=project_root) == 1
+
+
+def test_exec_command_restores_cwd_when_exec_fails(project_root: Path, monkeypatch):
+    target = project_root / "elsewhere"
+    target.mkdir()
+
+    def _missing(file, args):
+        raise FileNotFoundError(file)
+
+    monkeypatch.setattr(dev_cli.os, "execvp", _missing)
+
+    assert CLIRunner().exec_command(["no-such-binary"], cwd=target) == 1
+    assert Path.cwd() == project_root
+
+
+def test_create_parser_builds_only_the_requested_command():
+    parser = DevCLI().create_parser("up")
+    subparsers = next(
+        a for a in parser._actions if isinstance(a, argparse._SubParsersAction)
+    )
+
+    assert list(subparsers.choices) == ["up"]
+    args = parser.parse_args(["up", "--build"])
+    assert args.command == "up" and args.build
+
+
+def test_create_parser_builds_full_tree_without_known_command():
+    for command in (None, "--help", "no-such-command"):
+        parser = DevCLI().create_parser(command)
+        subparsers = next(
+            a for a in parser._actions if isinstance(a, argparse._SubParsersAction)
+        )
+        assert {"up", "test", "migrate", "promote-admin"} <= set(subparsers.choices)
+
+
+def test_run_tests_fans_out_with_xdist_unless_jobs_is_zero(monkeypatch):
+    cli = DevCLI()
+    commands = []
+    monkeypatch.setattr(cli.runner, "exec_command", lambda cmd: commands.append(cmd))
+
+    cli.run(["test", "src/"])
+    cli.run(["test", "-n", "0", "src/"])
+
+    assert commands == [
+        ["pytest", "-n", "auto", "--dist=loadfile", "src/"],
+        ["pytest", "src/"],
+    ]
+
+
+def test_lint_reports_checks_in_order_and_fails_if_any_fails(monkeypatch, capsys):
+    cli = DevCLI()
+    outputs = {"black": (0, "black ok\n"), "isort": (1, "isort bad\n")}
+    monkeypatch.setattr(
+        cli.runner,
+        "run_captured",
+        lambda cmd: outputs.get(cmd[0], (0, "title ok\n")),
+    )
+
+    assert cli.quality.lint() == 1
+
+    out = capsys.readouterr().out
+    assert out.index("black ok") < out.index("isort bad") < out.index("title ok")
+
+
+def test_docker_installation_is_probed_once_per_process(
+    fresh_docker_probe, monkeypatch
+):
+    calls = []
+
+    def _fake_run(cmd, **kwargs):
+        calls.append(cmd)
+        return subprocess.CompletedProcess(cmd, 0, stdout="v1\n", stderr="")
+
+    monkeypatch.setattr(dev_cli.shutil, "which", lambda name: "/usr/bin/docker")
+    monkeypatch.setattr(dev_cli.subprocess, "run", _fake_run)
+    runner = CLIRunner()
+    assert runner.check_docker_installation()
+    assert runner.check_docker_installation()
+
+    assert calls == [["docker", "compose", "version"]]
+
+
+def test_check_docker_installation_fails_without_docker_on_path(
+    fresh_docker_probe, monkeypatch
+):
+    monkeypatch.setattr(dev_cli.shutil, "which", lambda name: None)
+
+    assert not CLIRunner().check_docker_installation()
+
+
+def test_setup_prewarm_builds_and_creates_containers(project_root: Path, monkeypatch):
+    (project_root / ".env").write_text("")
+    monkeypatch.delenv("CI", raising=False)
+    monkeypatch.delenv("DOCKER_HOST", raising=False)
+    cli = DevCLI()
+    commands = []
+    monkeypatch.setattr(cli.runner, "check_docker_installation", lambda: True)
+    monkeypatch.setattr(
+        cli.runner, "run_command", lambda cmd: commands.append(cmd) or 0
+    )
+
+    assert cli.run(["setup"]) == 0
+    assert commands == []
+
+    assert cli.run(["setup", "--prewarm"]) == 0
+    assert commands == [[*dev_cli.COMPOSE_DEV_CMD, "create", "--build"]]
+
+
+def test_run_command_lets_interrupted_child_exit_before_killing(monkeypatch):
+    events = []
+
+    class _FakeProc:
+        def __init__(self, cmd, cwd):
+            self.waits = 0
+
+        def wait(self, timeout=None):
+            self.waits += 1
+            events.append(("wait", timeout))
+            if self.waits == 1:
+                raise KeyboardInterrupt
+            if timeout is not None:
+                raise subprocess.TimeoutExpired("cmd", timeout)
+            return -9
+
+        def kill(self):
+            events.append(("kill",))
+
+    monkeypatch.setattr(dev_cli.subprocess, "Popen", _FakeProc)
+
+    assert CLIRunner().run_command(["sleep", "60"]) == 130
+    assert events == [
+        ("wait", None),
+        ("wait", dev_cli.INTERRUPT_GRACE_SECONDS),
+        ("kill",),
+        ("wait", None),
+    ]
+
+
+def test_setup_skips_docker_checks_when_docker_host_is_set(
+    project_root: Path, monkeypatch
+):
+    (project_root / ".env").write_text("")
+    monkeypatch.setenv("DOCKER_HOST", "unix:///var/run/docker.sock")
+    cli = DevCLI()
+
+    def _fail():
+        raise AssertionError("docker checks should be skipped")
+
+    monkeypatch.setattr(cli.runner, "check_docker_installation", _fail)
+
+    assert cli.run(["setup"]) == 0
+
+
+def test_setup_creates_env_once_and_keeps_existing(project_root: Path, monkeypatch):
+    monkeypatch.setenv("CI", "true")
+    env_file = project_root / ".env"
+
+    assert DevCLI().run(["setup"]) == 0
+    assert env_file.read_text() == dev_cli.ENV_TEMPLATE
+    assert env_file.stat().st_mode & 0o777 == 0o600
+
+    env_file.write_text("SECRET=mine\n")
+    assert DevCLI().run(["setup"]) == 0
+    assert env_file.read_text() == "SECRET=mine\n"
+
+
+def test_setup_removes_partial_env_when_write_fails(project_root: Path, monkeypatch):
+    monkeypatch.setenv("CI", "true")
+
+    def _fail_write(fd, data):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(dev_cli.os, "write", _fail_write)
+
+    assert DevCLI().run(["setup"]) == 1
+    assert not (project_root / ".env").exists()
@@ -1,7 +1,7 @@
 # This file makes src/api/common a Python package
 
 from .base_router import BaseRouter
-from .decorators import handle_route_errors, log_route_call
+from .decorators import handle_route_errors, log_route_call, route_call
 from .exceptions import (
     APIException,
     BadRequestError,
@@ -17,6 +17,7 @@ __all__ = [
     "APIResponse",
     "log_route_call",
     "handle_route_errors",
+    "route_call",
     "APIException",
     "NotFoundError",
     "BadRequestError",
@@ -2,7 +2,7 @@ from typing import Any, Callable, List, Optional
 
 from fastapi import APIRouter, Depends
 
-from src.api.common.decorators import handle_route_errors, log_route_call
+from src.api.common.decorators import route_call
 
 
 class BaseRouter:
@@ -42,8 +42,7 @@ class BaseRouter:
 
         decorated_endpoint = endpoint
         if apply_common_decorators:
-            decorated_endpoint = handle_route_errors(decorated_endpoint)
-            decorated_endpoint = log_route_call(decorated_endpoint)
+            decorated_endpoint = route_call(decorated_endpoint)
 
         self.router.add_api_route(
             path,
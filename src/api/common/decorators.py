@@ -23,18 +23,22 @@ def log_route_call(func):
     It logs the function name, arguments, and whether it completed successfully or raised an error.
     """
 
+    route_logger = logging.getLogger(func.__module__)
+    route_name = func.__name__
+
     @wraps(func)
     async def wrapper(*args, **kwargs):
-        route_logger = logging.getLogger(func.__module__)
-
-        route_logger.debug(f"Entering route: {func.__name__}")
+        route_logger.debug("Entering route: %s", route_name)
         try:
             result = await func(*args, **kwargs)
-            route_logger.debug(f"Successfully exited route: {func.__name__}")
+            route_logger.debug("Successfully exited route: %s", route_name)
             return result
         except Exception as e:
             route_logger.error(
-                f"Error during route: {func.__name__}. Exception: {type(e).__name__} - {e}",
+                "Error during route: %s. Exception: %s - %s",
+                route_name,
+                type(e).__name__,
+                e,
                 exc_info=False,
             )
             raise
@@ -42,6 +46,47 @@ def log_route_call(func):
     return wrapper
 
 
+def _map_route_exception(e: Exception, route_name: str):
+    """
+    Logs an exception raised by a route and translates it: service and
+    fastapi-users errors go through handle_service_error, HTTPExceptions are
+    re-raised untouched, anything else becomes a 500.
+    Must be called from the `except` block that caught `e`.
+    """
+    if isinstance(
+        e,
+        (
+            BusinessRuleError,
+            ConflictError,
+            DatabaseError,
+            NotAuthorizedError,
+            UserNotFoundError,
+        ),
+    ):
+        logger.error("Service error in %s route: %s", route_name, e, exc_info=False)
+        return handle_service_error(e)
+    if isinstance(e, ServiceError):
+        logger.error(
+            "Generic service error in %s route: %s", route_name, e, exc_info=True
+        )
+        return handle_service_error(e)
+    if isinstance(e, fastapi_users_exceptions.FastAPIUsersException):
+        logger.warning(
+            "FastAPIUsers exception in %s route: %s - %s",
+            route_name,
+            type(e).__name__,
+            e,
+        )
+        return handle_service_error(e)
+    if isinstance(e, HTTPException):
+        raise
+    logger.error("Unexpected error in %s route: %s", route_name, e, exc_info=True)
+    raise HTTPException(
+        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        detail="An unexpected server error occurred.",
+    )
+
+
 def handle_route_errors(func):
     """
     A decorator to standardize error handling in API routes.
@@ -54,34 +99,40 @@ def handle_route_errors(func):
     async def wrapper(*args, **kwargs):
         try:
             return await func(*args, **kwargs)
-        except (
-            BusinessRuleError,
-            ConflictError,
-            DatabaseError,
-            NotAuthorizedError,
-            UserNotFoundError,
-        ) as e:
-            logger.error(f"Service error in {func.__name__} route: {e}", exc_info=False)
-            handle_service_error(e)
-        except ServiceError as e:
-            logger.error(
-                f"Generic service error in {func.__name__} route: {e}", exc_info=True
-            )
-            handle_service_error(e)
-        except fastapi_users_exceptions.FastAPIUsersException as e:
-            logger.warning(
-                f"FastAPIUsers exception in {func.__name__} route: {type(e).__name__} - {e}"
-            )
-            handle_service_error(e)
-        except HTTPException as e:
-            raise
         except Exception as e:
-            logger.error(
-                f"Unexpected error in {func.__name__} route: {e}", exc_info=True
-            )
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="An unexpected server error occurred.",
+            return _map_route_exception(e, func.__name__)
+
+    return wrapper
+
+
+def route_call(func):
+    """
+    `log_route_call` and `handle_route_errors` fused into one wrapper, so a
+    route pays for a single extra frame per request instead of two. Logging
+    matches the stacked form: the error log sees the translated exception.
+    """
+
+    route_logger = logging.getLogger(func.__module__)
+    route_name = func.__name__
+
+    @wraps(func)
+    async def wrapper(*args, **kwargs):
+        route_logger.debug("Entering route: %s", route_name)
+        try:
+            try:
+                result = await func(*args, **kwargs)
+            except Exception as e:
+                result = _map_route_exception(e, route_name)
+            route_logger.debug("Successfully exited route: %s", route_name)
+            return result
+        except Exception as e:
+            route_logger.error(
+                "Error during route: %s. Exception: %s - %s",
+                route_name,
+                type(e).__name__,
+                e,
+                exc_info=False,
             )
+            raise
 
     return wrapper
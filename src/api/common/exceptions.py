@@ -59,7 +59,9 @@ def handle_service_error(e: ServiceError):
     It standardizes how service layer errors are translated into HTTP responses.
     """
     logger.warning(
-        f"Handling service error: {e.__class__.__name__} - {getattr(e, 'message', str(e))}"
+        "Handling service error: %s - %s",
+        e.__class__.__name__,
+        getattr(e, "message", e),
     )
 
     if isinstance(e, UserNotFoundError):
@@ -89,7 +91,7 @@ def handle_service_error(e: ServiceError):
             status_code=status.HTTP_409_CONFLICT, detail=getattr(e, "message", str(e))
         )
     elif isinstance(e, DatabaseError):
-        logger.error(f"Database error: {e}", exc_info=True)
+        logger.error("Database error: %s", e, exc_info=True)
         raise InternalServerError(detail="A database error occurred.")
     elif isinstance(e, ServiceError):
         status_code = getattr(e, "status_code", status.HTTP_500_INTERNAL_SERVER_ERROR)
@@ -1,7 +1,28 @@
+import hashlib
+import secrets
 from typing import Any, Optional
 
+from fastapi import Request, Response, status
 from fastapi.responses import JSONResponse
 
+from src.core.templating import GLOBAL_TEMPLATE_CONTEXT, auto_reload, templates
+
+# Mixed into every ETag so a restart (new deploy, new templates) invalidates
+# whatever browsers have cached.
+_ETAG_SALT = secrets.token_bytes(8)
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match uses weak comparison: any listed tag, with or without
+    a `W/` prefix, or `*` matches."""
+    if not if_none_match:
+        return False
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag == "*" or tag.removeprefix("W/") == etag:
+            return True
+    return False
+
 
 class APIResponse:
     @staticmethod
@@ -23,15 +44,39 @@ class APIResponse:
         return JSONResponse(status_code=status_code, content=content)
 
     @staticmethod
-    def html_response(template_name: str, context: dict, request: Any) -> Any:
+    def html_response(
+        template_name: str,
+        context: dict,
+        request: Request,
+        etag_source: Optional[bytes] = None,
+    ) -> Response:
         """
         Helper for HTML responses using templates.
         Includes global template context for development features.
+        Starlette adds `request` to the context itself.
+
+        `etag_source` should cover everything the page shows; it becomes the
+        response's ETag, and a request whose If-None-Match matches gets a 304
+        without rendering. Ignored under template auto-reload, where the
+        template itself can change underneath an unchanged source.
         """
-        from src.core.templating import get_template_context, templates
+        etag = None
+        if etag_source is not None and not auto_reload:
+            digest = hashlib.blake2b(
+                _ETAG_SALT + template_name.encode() + b"\0" + etag_source,
+                digest_size=8,
+            ).hexdigest()
+            etag = f'"{digest}"'
+            headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+            if _etag_matches(request.headers.get("if-none-match"), etag):
+                return Response(
+                    status_code=status.HTTP_304_NOT_MODIFIED, headers=headers
+                )
 
         # Merge the provided context with global template context
-        global_context = get_template_context()
-        merged_context = {**global_context, **context}
+        merged_context = {**GLOBAL_TEMPLATE_CONTEXT, **context}
 
-        return templates.TemplateResponse(request, template_name, merged_context)
+        response = templates.TemplateResponse(request, template_name, merged_context)
+        if etag is not None:
+            response.headers.update(headers)
+        return response
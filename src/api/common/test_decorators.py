@@ -0,0 +1,53 @@
+"""Tests for the route decorators in `src/api/common/decorators.py`."""
+
+import pytest
+from fastapi import HTTPException
+
+from src.api.common.decorators import (
+    handle_route_errors,
+    log_route_call,
+    route_call,
+)
+from src.services.exceptions import NotAuthorizedError
+
+
+def _stacked(func):
+    return log_route_call(handle_route_errors(func))
+
+
+async def _ok(value):
+    return value
+
+
+async def _forbidden():
+    raise NotAuthorizedError("nope")
+
+
+async def _http_error():
+    raise HTTPException(status_code=418, detail="teapot")
+
+
+async def _crash():
+    raise RuntimeError("boom")
+
+
+async def test_route_call_returns_route_result():
+    assert await route_call(_ok)(value=42) == 42
+
+
+@pytest.mark.parametrize(
+    "route,status_code",
+    [(_forbidden, 403), (_http_error, 418), (_crash, 500)],
+)
+async def test_route_call_maps_errors_like_the_stacked_decorators(route, status_code):
+    with pytest.raises(HTTPException) as fused:
+        await route_call(route)()
+    with pytest.raises(HTTPException) as stacked:
+        await _stacked(route)()
+
+    assert fused.value.status_code == stacked.value.status_code == status_code
+    assert fused.value.detail == stacked.value.detail
+
+
+def test_route_call_keeps_the_endpoint_signature():
+    assert route_call(_ok).__wrapped__ is _ok
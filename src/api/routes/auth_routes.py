@@ -81,7 +81,7 @@ async def register_request_handler(
     Handles the core logic for user registration, delegated from the route handler.
     Relies on @handle_route_errors decorator (via BaseRouter) for exception handling.
     """
-    logger.debug(f"Handling registration for email: {request_data.email}")
+    logger.debug("Handling registration for email: %s", request_data.email)
     result = await handle_registration(
         request_data=request_data,
         request=request,
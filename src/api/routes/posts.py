@@ -1,4 +1,3 @@
-import logging
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, Request, Response, status
@@ -23,17 +22,20 @@ from src.schemas.post import PostCreate, PostUpdate
 
 posts_api_router = APIRouter(prefix="/posts")
 router = BaseRouter(router=posts_api_router, default_tags=["posts"])
-logger = logging.getLogger(__name__)
+
+
+# Per-kind edit templates, built once rather than on every edit-form request.
+_EDIT_TEMPLATES = {
+    "client_referral": "posts/edit_client_referral.html",
+    "provider_availability": "posts/edit_provider_availability.html",
+}
 
 
 def _edit_template_for(kind: str) -> str:
-    """Per-kind edit template lookup. Add an entry when a kind grows
-    editable fields and a corresponding template under
+    """Per-kind edit template lookup. Add an entry to `_EDIT_TEMPLATES` when a
+    kind grows editable fields and a corresponding template under
     `src/templates/posts/edit_<kind>.html`."""
-    return {
-        "client_referral": "posts/edit_client_referral.html",
-        "provider_availability": "posts/edit_provider_availability.html",
-    }[kind]
+    return _EDIT_TEMPLATES[kind]
 
 
 @router.get("")
@@ -65,7 +67,7 @@ async def get_post_form(
 
     Registered before `/{post_id}` so the literal `form` is not parsed as a UUID.
     """
-    context = await handle_get_post_form(request=request, requesting_user=user)
+    context = handle_get_post_form(request=request, requesting_user=user)
     return APIResponse.html_response(
         template_name="posts/new.html", context=context, request=request
     )
@@ -382,6 +382,74 @@ async def test_delete_404_for_unknown_user(
     assert response.status_code == 404
 
 
+# --- Profile page --------------------------------------------------------
+
+
+async def test_profile_page_revalidates_with_etag(
+    authenticated_client: AsyncClient,
+    logged_in_user: User,
+    monkeypatch,
+):
+    """Outside template auto-reload the profile carries an ETag, and a
+    matching If-None-Match gets an empty 304 instead of a render."""
+    monkeypatch.setattr("src.api.common.responses.auto_reload", False)
+
+    first = await authenticated_client.get("/users/me/profile")
+    assert first.status_code == 200
+    etag = first.headers["etag"]
+    assert logged_in_user.email in first.text
+
+    again = await authenticated_client.get(
+        "/users/me/profile", headers={"If-None-Match": etag}
+    )
+    assert again.status_code == 304
+    assert again.headers["etag"] == etag
+    assert again.content == b""
+
+
+@pytest.mark.parametrize(
+    "if_none_match",
+    ['"stale", {etag}', "W/{etag}", "*"],
+    ids=["tag-list", "weak-tag", "wildcard"],
+)
+async def test_profile_page_304_for_listed_weak_or_wildcard_etag(
+    authenticated_client: AsyncClient,
+    monkeypatch,
+    if_none_match: str,
+):
+    monkeypatch.setattr("src.api.common.responses.auto_reload", False)
+
+    etag = (await authenticated_client.get("/users/me/profile")).headers["etag"]
+
+    again = await authenticated_client.get(
+        "/users/me/profile", headers={"If-None-Match": if_none_match.format(etag=etag)}
+    )
+    assert again.status_code == 304
+
+
+async def test_profile_page_renders_when_no_listed_etag_matches(
+    authenticated_client: AsyncClient,
+    monkeypatch,
+):
+    monkeypatch.setattr("src.api.common.responses.auto_reload", False)
+
+    response = await authenticated_client.get(
+        "/users/me/profile", headers={"If-None-Match": '"stale", W/"older"'}
+    )
+    assert response.status_code == 200
+
+
+async def test_profile_page_has_no_etag_under_auto_reload(
+    authenticated_client: AsyncClient,
+    monkeypatch,
+):
+    monkeypatch.setattr("src.api.common.responses.auto_reload", True)
+
+    response = await authenticated_client.get("/users/me/profile")
+    assert response.status_code == 200
+    assert "etag" not in response.headers
+
+
 # --- Audit log -----------------------------------------------------------
 
 
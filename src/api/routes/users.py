@@ -1,4 +1,3 @@
-import logging
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, Request, Response, status
@@ -20,7 +19,6 @@ from src.schemas.user import UserActivationUpdate
 
 users_api_router = APIRouter(prefix="/users")
 router = BaseRouter(router=users_api_router, default_tags=["users"])
-logger = logging.getLogger(__name__)
 
 
 @router.get("")
@@ -1,4 +1,5 @@
 import os
+from types import MappingProxyType
 
 from fastapi.templating import Jinja2Templates
 from jinja2 import Environment, FileSystemLoader, select_autoescape
@@ -9,15 +10,32 @@ _env = Environment(
     loader=FileSystemLoader("src/templates"),
     autoescape=select_autoescape(["html", "xml"]),
     auto_reload=auto_reload,
+    # Without auto-reload templates never change, so never evict a compiled one
+    cache_size=400 if auto_reload else -1,
 )
 
 templates = Jinja2Templates(env=_env)
 
 
-# Add global template variables for development features
-def get_template_context():
-    """Get global template context with environment information."""
-    return {
-        "is_development": os.getenv("ENVIRONMENT", "development") == "development",
+def warm_templates() -> int:
+    """Compile every template into the environment's cache so no request pays
+    lex/parse/compile cost. Skipped under auto-reload, where templates are
+    re-checked anyway. Returns how many were compiled.
+    """
+    if auto_reload:
+        return 0
+    names = _env.list_templates(extensions=["html"])
+    for name in names:
+        _env.get_template(name)
+    return len(names)
+
+
+# Global template variables for development features. The environment doesn't
+# change while the app runs, so this is read once at import (read-only, since
+# every response shares it).
+GLOBAL_TEMPLATE_CONTEXT = MappingProxyType(
+    {
+        "is_development": auto_reload,
         "livereload_port": os.getenv("LIVERELOAD_PORT", "35729"),
     }
+)
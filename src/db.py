@@ -1,3 +1,4 @@
+import asyncio
 import logging
 import os
 from collections.abc import AsyncGenerator
@@ -7,6 +8,7 @@ from dotenv import load_dotenv
 from fastapi import Depends
 from fastapi_users.db import SQLAlchemyUserDatabase
 from sqlalchemy import text
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 from .models import User, metadata
@@ -17,7 +19,37 @@ DATABASE_URL = os.getenv("DATABASE_URL")
 if not DATABASE_URL:
     raise ValueError("DATABASE_URL environment variable is not set")
 
-engine = create_async_engine(DATABASE_URL)
+
+def _is_in_memory_sqlite(url: str) -> bool:
+    """Mirror the SQLite dialect's own test for picking `StaticPool`: no
+    database (`sqlite://`, `sqlite:///`), `:memory:`, or `mode=memory`."""
+    parsed = make_url(url)
+    if parsed.get_backend_name() != "sqlite":
+        return False
+    return (
+        parsed.database in (None, "", ":memory:")
+        or parsed.query.get("mode") == "memory"
+    )
+
+
+def _engine_options(url: str) -> dict[str, Any]:
+    """Connection-pool options for `create_async_engine`.
+
+    In-memory SQLite is served from a single `StaticPool` connection, which
+    rejects pool sizing arguments, so only file/server URLs get them. Sizes
+    are tunable via `DB_POOL_SIZE` / `DB_MAX_OVERFLOW` / `DB_POOL_RECYCLE`.
+    """
+    if _is_in_memory_sqlite(url):
+        return {}
+    return {
+        "pool_size": int(os.getenv("DB_POOL_SIZE", "20")),
+        "max_overflow": int(os.getenv("DB_MAX_OVERFLOW", "30")),
+        "pool_recycle": int(os.getenv("DB_POOL_RECYCLE", "1800")),
+        "pool_pre_ping": True,
+    }
+
+
+engine = create_async_engine(DATABASE_URL, **_engine_options(DATABASE_URL))
 async_session_maker = async_sessionmaker(engine, expire_on_commit=False)
 
 
@@ -34,6 +66,36 @@ async def get_user_db(
     yield SQLAlchemyUserDatabase(session, User)
 
 
+async def warm_connection_pool() -> int:
+    """Open `pool_size` connections concurrently so the first burst of
+    requests doesn't pay connect cost on checkout. Returns how many were opened.
+
+    Best effort: if some connects fail, the ones that opened are still
+    returned to the pool and the failure is logged rather than raised.
+    """
+    size = engine.pool.size() if hasattr(engine.pool, "size") else 0
+    if size <= 0:
+        return 0
+
+    # Hold every connection until all are open; releasing early would let
+    # the pool hand the same connection back out and under-fill the warmup.
+    results = await asyncio.gather(
+        *(engine.connect().start() for _ in range(size)), return_exceptions=True
+    )
+    connections = [r for r in results if not isinstance(r, BaseException)]
+    await asyncio.gather(*(conn.close() for conn in connections))
+
+    failures = [r for r in results if isinstance(r, BaseException)]
+    if failures:
+        logging.getLogger(__name__).warning(
+            "Pool warmup opened %d of %d connection(s): %s",
+            len(connections),
+            size,
+            failures[0],
+        )
+    return len(connections)
+
+
 async def check_database_health(skip_table_check=False) -> bool:
     """
     Check if the database connection is working and all required tables exist.
@@ -69,7 +131,7 @@ async def check_database_health(skip_table_check=False) -> bool:
                     f"Database migration required. Missing tables: {missing_tables}"
                 )
 
-            logger.debug(f"All required tables present: {expected_tables}")
+            logger.debug("All required tables present: %s", expected_tables)
             return True
 
     except Exception as e:
@@ -1,5 +1,4 @@
 # src/logic/auth_processing.py
-import logging
 
 from fastapi import Depends, Request
 from fastapi_users import models
@@ -11,8 +10,6 @@ from src.repositories.audit_repository import AuditRepository
 from src.repositories.dependencies import get_audit_repository
 from src.schemas.user import UserAuditSnapshot, UserCreate, UserRead
 
-logger = logging.getLogger(__name__)
-
 AppUserManager = UserManagerDependency[models.UP, models.ID]
 
 
@@ -74,11 +74,14 @@ async def handle_get_post_detail(
     return {"request": request, "post": post, "current_user": requesting_user}
 
 
-async def handle_get_post_form(
+def handle_get_post_form(
     request: Request,
     requesting_user: User,
 ):
-    """Builds the template context for the create-post form."""
+    """Builds the template context for the create-post form.
+
+    Plain `def`: there is nothing to await, so no coroutine per request.
+    """
     return {"request": request, "current_user": requesting_user}
 
 
@@ -93,7 +96,7 @@ async def handle_get_post_edit_form(
 
     Per-kind template selection happens in the route layer.
     """
-    post = await post_repo.get_post_by_id(post_id)
+    post = await post_repo.get_post_by_id(post_id, load_relations=False)
     if post is None:
         raise NotFoundError(detail="Post not found")
 
@@ -146,7 +149,7 @@ async def handle_update_post(
     PATCH cannot repurpose a post's identity. 404 if missing, 403 if not
     authorized, 422 if the body's kind doesn't match or carries no edits.
     """
-    post = await post_repo.get_post_by_id(post_id)
+    post = await post_repo.get_post_by_id(post_id, load_relations=False)
     if post is None:
         raise NotFoundError(detail="Post not found")
 
@@ -188,7 +191,7 @@ async def handle_delete_post(
 
     404 if missing, 403 if not authorized.
     """
-    post = await post_repo.get_post_by_id(post_id)
+    post = await post_repo.get_post_by_id(post_id, load_relations=False)
     if post is None:
         raise NotFoundError(detail="Post not found")
 
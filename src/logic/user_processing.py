@@ -52,7 +52,7 @@ async def handle_list_users(
     Raises:
         Exception: Propagates exceptions from the repository layer.
     """
-    logger.debug(f"Handler: Listing users for user {requesting_user.id}.")
+    logger.debug("Handler: Listing users for user %s.", requesting_user.id)
 
     try:
         users_list = await user_repo.list_users(
@@ -60,12 +60,14 @@ async def handle_list_users(
         )
     except Exception as e:
         logger.error(
-            f"Handler: Error listing users from repository: {e}", exc_info=True
+            "Handler: Error listing users from repository: %s", e, exc_info=True
         )
         raise
 
     logger.debug(
-        f"Handler: Successfully retrieved {len(users_list)} users for user {requesting_user.id}."
+        "Handler: Successfully retrieved %d users for user %s.",
+        len(users_list),
+        requesting_user.id,
     )
 
     return {"request": request, "users": users_list, "current_user": requesting_user}
@@ -7,7 +7,8 @@ from fastapi.responses import JSONResponse, RedirectResponse
 
 from src.api.routes import auth_routes
 from src.auth_config import auth_backend, fastapi_users
-from src.db import check_database_health
+from src.core.templating import warm_templates
+from src.db import check_database_health, warm_connection_pool
 from src.schemas.user import UserRead
 
 from .api.routes import auth_pages, me, posts, users
@@ -43,6 +44,11 @@ async def lifespan(app: FastAPI):
         logger.error("Application startup aborted due to database issues")
         raise
 
+    warmed = await warm_connection_pool()
+    logger.info("Pre-opened %d pooled database connection(s)", warmed)
+    compiled = warm_templates()
+    logger.info("Precompiled %d template(s)", compiled)
+
     yield
 
 
@@ -130,7 +130,10 @@ class Post(BaseModel):
     )
     kind = Column(Text, nullable=False)
 
-    owner = relationship("User", lazy="joined")
+    # Eager loading is chosen per query by `PostRepository.query_options`;
+    # "raise" turns a forgotten eager load into an error instead of a lazy
+    # SELECT (which async sessions can't issue anyway).
+    owner = relationship("User", lazy="raise")
 
     __table_args__ = (
         CheckConstraint(
@@ -0,0 +1,22 @@
+"""Guardrail: relationship loading is chosen per query, never per model.
+
+A model-level `lazy="selectin"`/`"joined"` fires on every load of the
+parent, including reads that never touch the relation. Relationships must
+default to `lazy="raise"` and be eager-loaded explicitly by the repository
+method whose caller serializes them (see `BaseRepository.query_options`).
+"""
+
+from sqlalchemy.orm import configure_mappers
+
+from src.models import BaseModel
+
+
+def test_every_relationship_defaults_to_raise():
+    configure_mappers()
+    offenders = [
+        f"{mapper.class_.__name__}.{rel.key} (lazy={rel.lazy!r})"
+        for mapper in BaseModel.registry.mappers
+        for rel in mapper.relationships
+        if rel.lazy != "raise"
+    ]
+    assert offenders == []
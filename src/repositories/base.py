@@ -1,6 +1,17 @@
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.interfaces import LoaderOption
 
 
 class BaseRepository:
     def __init__(self, session: AsyncSession):
         self.session = session
+
+    def query_options(self, *, load_relations: bool = True) -> tuple[LoaderOption, ...]:
+        """Loader options applied to this repository's entity reads.
+
+        Subclasses override to eager-load the relations their callers
+        serialize, so rendering a list costs one round-trip instead of one
+        per row. Callers that never touch relations pass
+        `load_relations=False` and skip the extra JOIN/SELECT.
+        """
+        return ()
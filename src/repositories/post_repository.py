@@ -3,7 +3,8 @@ from uuid import UUID
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import with_polymorphic
+from sqlalchemy.orm import joinedload, with_polymorphic
+from sqlalchemy.orm.interfaces import LoaderOption
 
 from src.models import ClientReferral, Post, ProviderAvailability
 
@@ -19,19 +20,42 @@ class PostRepository(BaseRepository):
     def __init__(self, session: AsyncSession):
         super().__init__(session)
 
-    async def get_post_by_id(self, post_id: UUID) -> Post | None:
-        """Retrieves a post by its ID, materialized as its kind-specific subclass."""
-        stmt = select(_POLYMORPHIC_POST).filter(_POLYMORPHIC_POST.id == post_id)
+    def query_options(self, *, load_relations: bool = True) -> tuple[LoaderOption, ...]:
+        """Joins `owner` in the same SELECT — list/detail pages render the
+        owner's username for every post, and `Post.owner` is `lazy="raise"`
+        so a missed eager load fails loudly instead of issuing N+1 queries.
+        """
+        if not load_relations:
+            return ()
+        return (joinedload(_POLYMORPHIC_POST.owner),)
+
+    async def get_post_by_id(
+        self, post_id: UUID, *, load_relations: bool = True
+    ) -> Post | None:
+        """Retrieves a post by its ID, materialized as its kind-specific subclass.
+
+        Pass `load_relations=False` when the caller only needs the post's own
+        columns (authorization checks, updates, deletes).
+        """
+        stmt = (
+            select(_POLYMORPHIC_POST)
+            .filter(_POLYMORPHIC_POST.id == post_id)
+            .options(*self.query_options(load_relations=load_relations))
+        )
         result = await self.session.execute(stmt)
         return result.scalars().first()
 
-    async def list_posts(self) -> Sequence[Post]:
+    async def list_posts(self, *, load_relations: bool = True) -> Sequence[Post]:
         """Lists all posts (every kind), newest first.
 
         Uses `with_polymorphic` so each row comes back as the matching subclass
         instance with its child-table columns already loaded.
         """
-        stmt = select(_POLYMORPHIC_POST).order_by(_POLYMORPHIC_POST.created_at.desc())
+        stmt = (
+            select(_POLYMORPHIC_POST)
+            .options(*self.query_options(load_relations=load_relations))
+            .order_by(_POLYMORPHIC_POST.created_at.desc())
+        )
         result = await self.session.execute(stmt)
         return result.scalars().all()
 
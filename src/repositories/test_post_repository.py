@@ -0,0 +1,73 @@
+"""Tests for `PostRepository` relationship loading.
+
+`Post.owner` is `lazy="raise"`, so these pin down which reads eager-load it
+(list/detail, via `query_options`) and which deliberately skip it.
+"""
+
+import uuid
+
+import pytest
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.models import ProviderAvailability
+from src.repositories.post_repository import PostRepository
+from tests.helpers import create_test_user
+
+pytestmark = pytest.mark.asyncio
+
+
+async def _seed_post(
+    session_maker: async_sessionmaker[AsyncSession],
+) -> ProviderAvailability:
+    owner = create_test_user(username=f"owner-{uuid.uuid4()}")
+    post = ProviderAvailability(
+        kind="provider_availability",
+        owner_id=owner.id,
+        specialty="CBT",
+        region="NYC",
+        accepting_new_clients=True,
+    )
+    async with session_maker() as session:
+        async with session.begin():
+            session.add(owner)
+            session.add(post)
+    return post
+
+
+async def test_list_posts_eager_loads_owner(
+    db_test_session_manager: async_sessionmaker[AsyncSession],
+):
+    seeded = await _seed_post(db_test_session_manager)
+
+    async with db_test_session_manager() as session:
+        posts = await PostRepository(session).list_posts()
+
+    assert [p.id for p in posts] == [seeded.id]
+    assert posts[0].owner.username.startswith("owner-")
+
+
+async def test_get_post_by_id_eager_loads_owner(
+    db_test_session_manager: async_sessionmaker[AsyncSession],
+):
+    seeded = await _seed_post(db_test_session_manager)
+
+    async with db_test_session_manager() as session:
+        post = await PostRepository(session).get_post_by_id(seeded.id)
+
+    assert post.owner.id == post.owner_id
+
+
+async def test_load_relations_false_skips_owner(
+    db_test_session_manager: async_sessionmaker[AsyncSession],
+):
+    seeded = await _seed_post(db_test_session_manager)
+
+    async with db_test_session_manager() as session:
+        post = await PostRepository(session).get_post_by_id(
+            seeded.id, load_relations=False
+        )
+
+        assert post.specialty == "CBT"
+        with pytest.raises(InvalidRequestError):
+            _ = post.owner
@@ -1,43 +1,52 @@
-import logging
-
-logger = logging.getLogger(__name__)
+from typing import Optional
 
 
 class ServiceError(Exception):
-    """Base class for service layer errors."""
-
-    def __init__(self, message="An internal service error occurred.", status_code=500):
-        self.message = message
-        self.status_code = status_code
+    """Base class for service layer errors.
+
+    Each subclass declares its HTTP status and default message as class
+    attributes; raising one only stores the message.
+    """
+
+    status_code: int = 500
+    default_message: str = "An internal service error occurred."
+
+    def __init__(
+        self, message: Optional[str] = None, status_code: Optional[int] = None
+    ):
+        self.message = self.default_message if message is None else message
+        if status_code is not None:
+            # Instance override; the class attribute stays the default
+            self.status_code = status_code
         super().__init__(self.message)
 
 
 class UserNotFoundError(ServiceError):
-    def __init__(self, message="User not found."):
-        super().__init__(message, status_code=404)
+    status_code = 404
+    default_message = "User not found."
 
 
 class NotAuthorizedError(ServiceError):
-    def __init__(self, message="User not authorized for this action."):
-        super().__init__(message, status_code=403)
+    status_code = 403
+    default_message = "User not authorized for this action."
 
 
 class BusinessRuleError(ServiceError):
     """For violations of specific business rules (e.g., user offline)."""
 
-    def __init__(self, message="Action violates business rules."):
-        super().__init__(message, status_code=400)  # Often a Bad Request
+    status_code = 400  # Often a Bad Request
+    default_message = "Action violates business rules."
 
 
 class ConflictError(ServiceError):
     """For conflicts like trying to add an existing participant."""
 
-    def __init__(self, message="Operation conflicts with existing state."):
-        super().__init__(message, status_code=409)
+    status_code = 409
+    default_message = "Operation conflicts with existing state."
 
 
 class DatabaseError(ServiceError):
     """For general database errors during service operations."""
 
-    def __init__(self, message="A database error occurred."):
-        super().__init__(message, status_code=500)
+    status_code = 500
+    default_message = "A database error occurred."
@@ -1,5 +1,6 @@
 import logging
-from typing import Any, Dict, Type, TypeVar
+from typing import Any, Type, TypeVar
+from weakref import WeakValueDictionary
 
 T = TypeVar("T")
 logger = logging.getLogger(__name__)
@@ -7,32 +8,38 @@ logger = logging.getLogger(__name__)
 
 class ServiceProvider:
     """
-    A simple service provider that manages singleton instances of services.
-    Services are instantiated once and reused.
+    A service provider that shares instances of services while they are in use.
+    This is not a singleton provider: instances are held weakly, so once no
+    caller keeps a strong reference the instance is collected and the next
+    `get_service` call builds a new one.
     """
 
-    _instances: Dict[Type[T], T] = {}
+    _instances: "WeakValueDictionary[Type[Any], Any]" = WeakValueDictionary()
 
     @classmethod
-    def get_service(cls, service_class: Type[T], **dependencies: Any) -> T:
+    def get_service(cls, service_class: Type[T]) -> T:
         """
-        Retrieves or creates a singleton instance of the given service class.
-        Dependencies for the service are passed as keyword arguments.
+        Retrieves the live instance of a service class whose constructor takes
+        no arguments, creating one if none is currently referenced.
         """
-        if service_class not in cls._instances:
-            try:
-                logger.debug(
-                    f"Creating new instance of service: {service_class.__name__}"
-                )
-                cls._instances[service_class] = service_class(**dependencies)
-            except Exception as e:
-                logger.error(
-                    f"Failed to initialize service {service_class.__name__}: {e}",
-                    exc_info=True,
-                )
-                # Consider raising a specific ServiceInitializationError if needed
-                raise
-        return cls._instances[service_class]
+        try:
+            return cls._instances[service_class]
+        except KeyError:
+            pass
+
+        try:
+            logger.debug("Creating new instance of service: %s", service_class.__name__)
+            instance = cls._instances[service_class] = service_class()
+        except Exception as e:
+            logger.error(
+                "Failed to initialize service %s: %s",
+                service_class.__name__,
+                e,
+                exc_info=True,
+            )
+            # Consider raising a specific ServiceInitializationError if needed
+            raise
+        return instance
 
     @classmethod
     def clear(cls) -> None:
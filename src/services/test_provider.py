@@ -0,0 +1,42 @@
+"""Tests for `ServiceProvider`."""
+
+import gc
+import weakref
+
+import pytest
+
+from src.services.provider import ServiceProvider
+
+
+class _Service:
+    pass
+
+
+@pytest.fixture(autouse=True)
+def _reset_provider():
+    ServiceProvider.clear()
+    yield
+    ServiceProvider.clear()
+
+
+def test_get_service_returns_same_instance():
+    first = ServiceProvider.get_service(_Service)
+    assert ServiceProvider.get_service(_Service) is first
+
+
+def test_clear_resets_instances():
+    cached_instance = ServiceProvider.get_service(_Service)
+
+    ServiceProvider.clear()
+
+    assert ServiceProvider.get_service(_Service) is not cached_instance
+
+
+def test_get_service_drops_unreferenced_instances():
+    instance = ServiceProvider.get_service(_Service)
+    ref = weakref.ref(instance)
+
+    del instance
+    gc.collect()
+
+    assert ref() is None
@@ -1,7 +1,2 @@
-import logging
-
-logger = logging.getLogger(__name__)
-
-
 class UserService:
     pass
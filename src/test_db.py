@@ -0,0 +1,91 @@
+"""Tests for the engine/pool configuration in `src/db.py`."""
+
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from src import db
+
+
+def test_engine_options_skip_pool_sizing_for_in_memory_sqlite():
+    assert db._engine_options("sqlite+aiosqlite:///:memory:") == {}
+    assert db._engine_options("sqlite+aiosqlite:///file:x?mode=memory") == {}
+    assert db._engine_options("sqlite+aiosqlite://") == {}
+    assert db._engine_options("sqlite+aiosqlite:///") == {}
+
+
+@pytest.mark.parametrize(
+    "url",
+    ["sqlite+aiosqlite://", "sqlite+aiosqlite:///", "sqlite+aiosqlite:///:memory:"],
+)
+async def test_in_memory_urls_build_an_engine(url):
+    engine = create_async_engine(url, **db._engine_options(url))
+    await engine.dispose()
+
+
+def test_engine_options_defaults_for_file_url(monkeypatch):
+    for var in ("DB_POOL_SIZE", "DB_MAX_OVERFLOW", "DB_POOL_RECYCLE"):
+        monkeypatch.delenv(var, raising=False)
+
+    options = db._engine_options("sqlite+aiosqlite:///./data/app.db")
+
+    assert options == {
+        "pool_size": 20,
+        "max_overflow": 30,
+        "pool_recycle": 1800,
+        "pool_pre_ping": True,
+    }
+
+
+def test_engine_options_read_env_overrides(monkeypatch):
+    monkeypatch.setenv("DB_POOL_SIZE", "3")
+    monkeypatch.setenv("DB_MAX_OVERFLOW", "4")
+
+    options = db._engine_options("sqlite+aiosqlite:///./data/app.db")
+
+    assert options["pool_size"] == 3
+    assert options["max_overflow"] == 4
+
+
+@pytest.mark.asyncio
+async def test_warm_connection_pool_fills_pool(tmp_path, monkeypatch):
+    url = f"sqlite+aiosqlite:///{tmp_path / 'warm.db'}"
+    monkeypatch.setenv("DB_POOL_SIZE", "3")
+    engine = create_async_engine(url, **db._engine_options(url))
+    monkeypatch.setattr(db, "engine", engine)
+    try:
+        assert await db.warm_connection_pool() == 3
+        assert engine.pool.checkedin() == 3
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_warm_connection_pool_closes_opened_connections_on_failure(
+    monkeypatch,
+):
+    closed = []
+
+    class _Connection:
+        def __init__(self, fail: bool):
+            self.fail = fail
+
+        async def start(self):
+            if self.fail:
+                raise ConnectionRefusedError("database not ready")
+            return self
+
+        async def close(self):
+            closed.append(self)
+
+    attempts = iter([False, True, False])
+    fake_engine = SimpleNamespace(
+        pool=SimpleNamespace(size=lambda: 3),
+        connect=lambda: _Connection(fail=next(attempts)),
+    )
+    monkeypatch.setattr(db, "engine", fake_engine)
+
+    assert await db.warm_connection_pool() == 2
+    assert len(closed) == 2
+    assert all(not conn.fail for conn in closed)
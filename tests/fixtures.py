@@ -5,6 +5,7 @@ from asyncstdlib import anext
 from fastapi import Depends, FastAPI
 from fastapi_users.db import SQLAlchemyUserDatabase
 from httpx import ASGITransport, AsyncClient
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 from src.core.templating import templates  # Import the global templates object
@@ -21,32 +22,63 @@ from src.schemas.user import UserCreate  # Import UserCreate schema
 # from fastapi import Depends
 
 
-# Use an in-memory SQLite database for testing
-TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
+# One shared-cache in-memory SQLite database for the whole run. The schema is
+# built once; each test works inside a transaction that is rolled back after.
+TEST_DATABASE_URL = "sqlite+aiosqlite:///file:testdb?mode=memory&cache=shared&uri=true"
 
 test_engine = create_async_engine(TEST_DATABASE_URL)
 async_test_sessionmaker = async_sessionmaker(test_engine, expire_on_commit=False)
 
 
-# Master fixture to manage table creation/dropping and provide session maker
-@pytest.fixture(scope="function")
-async def db_test_session_manager() -> (
-    AsyncGenerator[async_sessionmaker[AsyncSession], None]
-):
-    # Create tables before test runs
+# pysqlite only emits BEGIN lazily before DML, so a session's SAVEPOINT would
+# open the outer transaction and its RELEASE would commit it. Take over
+# transaction control so the per-test rollback discards everything.
+# `PRAGMA foreign_keys` is a no-op inside a transaction, so it is set here.
+# Note the app engine (src/db.py) does not enable it; see tests/README.md.
+@event.listens_for(test_engine.sync_engine, "connect")
+def _configure_sqlite_connection(dbapi_connection, connection_record):
+    dbapi_connection.isolation_level = None
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA foreign_keys = ON")
+    cursor.close()
+
+
+@event.listens_for(test_engine.sync_engine, "begin")
+def _emit_begin(conn):
+    conn.exec_driver_sql("BEGIN")
+
+
+# Create tables once per test session
+@pytest.fixture(scope="session")
+async def test_schema() -> AsyncGenerator[None, None]:
     async with test_engine.begin() as conn:
         await conn.run_sync(metadata.create_all)
+    yield
+    await test_engine.dispose()
 
-    yield async_test_sessionmaker  # Provide the session maker to tests
 
-    # Drop tables after test finishes
-    async with test_engine.begin() as conn:
-        await conn.run_sync(metadata.drop_all)
+# Master fixture: binds the session maker to a per-test transaction
+@pytest.fixture(scope="function")
+async def db_test_session_manager(
+    test_schema: None,
+) -> AsyncGenerator[async_sessionmaker[AsyncSession], None]:
+    async with test_engine.connect() as conn:
+        trans = await conn.begin()
+        # Sessions join the test's transaction; their commits only release a
+        # SAVEPOINT, so the rollback below leaves the next test a clean slate.
+        async_test_sessionmaker.configure(
+            bind=conn, join_transaction_mode="create_savepoint"
+        )
+        try:
+            yield async_test_sessionmaker  # Provide the session maker to tests
+        finally:
+            async_test_sessionmaker.configure(bind=test_engine)
+            await trans.rollback()
 
 
 # Override for the raw AsyncSession dependency
-# Uses the globally defined async_test_sessionmaker
-# Table lifecycle managed by db_test_session_manager fixture
+# Uses the globally defined async_test_sessionmaker, which
+# db_test_session_manager binds to the current test's transaction
 async def override_get_db_session() -> AsyncGenerator[AsyncSession, None]:
     async with async_test_sessionmaker() as session:
         yield session
@@ -167,7 +199,7 @@ async def authenticated_client(
     # Clean up: remove the header after the test
     del test_client.headers["Cookie"]
 
-    # Optional: Delete the user after test if needed, though DB drop handles it
+    # Optional: Delete the user after test if needed, though the rollback handles it
     # async with db_test_session_manager() as session:
     #     await session.delete(user)
     #     await session.commit()
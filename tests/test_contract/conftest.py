@@ -62,11 +62,20 @@ async def browser():
         await browser.close()
 
 
+@pytest.fixture(scope="module")
+async def browser_context(browser):
+    """One BrowserContext per module; pages are cheap, contexts are not."""
+    context = await browser.new_context()
+    yield context
+    await context.close()
+
+
 @pytest.fixture(scope="function")
-async def page(browser):
-    page = await browser.new_page()
+async def page(browser_context):
+    page = await browser_context.new_page()
     yield page
     await page.close()
+    await browser_context.clear_cookies()
 
 
 @pytest.fixture(scope="module")
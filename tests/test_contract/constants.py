@@ -2,6 +2,8 @@
 
 import uuid
 
+from .infrastructure.config import worker_port
+
 # Test user data
 TEST_EMAIL = "test.user@example.com"
 TEST_PASSWORD = "securepassword123"
@@ -87,11 +89,13 @@ CONSUMER_NAME_POST_OWNER_ACTIONS = "post-owner-actions"
 PROVIDER_NAME_POSTS = "posts-api"
 
 # Timeouts
-NETWORK_TIMEOUT_MS = 500
+# Upper bound on waiting for an intercepted API response; tests return as soon
+# as the response lands.
+NETWORK_TIMEOUT_MS = 5000
 
 # Pact ports (one port per consumer-provider pair)
-PACT_PORT_AUTH = 1234
-PACT_PORT_USER_ACTIVATION = 1235
-PACT_PORT_POST_CREATE = 1236
-PACT_PORT_POST_EDIT = 1237
-PACT_PORT_POST_DELETE = 1238
+PACT_PORT_AUTH = worker_port(1234)
+PACT_PORT_USER_ACTIVATION = worker_port(1235)
+PACT_PORT_POST_CREATE = worker_port(1236)
+PACT_PORT_POST_EDIT = worker_port(1237)
+PACT_PORT_POST_DELETE = worker_port(1238)
@@ -13,9 +13,25 @@ PACT_LOG_DIR = os.path.abspath(
     os.path.join(os.path.dirname(__file__), "..", "artifacts", "logs")
 )
 
+# Each pytest-xdist worker gets its own block of ports so parallel workers never
+# race for the same listener. Fixed ports per worker stay predictable, so there
+# is no free-port probing at fixture time.
+WORKER_PORT_STRIDE = 10
+
+
+def _worker_index(worker_id: str) -> int:
+    return int(worker_id[2:]) if worker_id.startswith("gw") else 0
+
+
+def worker_port(base_port: int) -> int:
+    """Offset `base_port` into the current xdist worker's port block."""
+    worker_id = os.environ.get("PYTEST_XDIST_WORKER", "main")
+    return base_port + _worker_index(worker_id) * WORKER_PORT_STRIDE
+
+
 # Provider server configuration
 PROVIDER_HOST = "127.0.0.1"
-PROVIDER_PORT = 8999
+PROVIDER_PORT = worker_port(8999)
 PROVIDER_BASE_URL = URL(f"http://{PROVIDER_HOST}:{PROVIDER_PORT}")
 PROVIDER_STATE_SETUP_ENDPOINT_PATH = "_pact/provider_states"
 PROVIDER_STATE_SETUP_FULL_URL = str(
@@ -24,7 +40,7 @@ PROVIDER_STATE_SETUP_FULL_URL = str(
 
 # Consumer server configuration
 CONSUMER_HOST = "127.0.0.1"
-CONSUMER_PORT = 8990
+CONSUMER_PORT = worker_port(8990)
 CONSUMER_BASE_URL = URL(f"http://{CONSUMER_HOST}:{CONSUMER_PORT}")
 
 # Database configuration
@@ -2,6 +2,7 @@
 
 import logging
 import multiprocessing
+import socket
 import time
 from typing import Callable, Optional
 
@@ -11,6 +12,20 @@ from requests.exceptions import ConnectionError
 from yarl import URL
 
 
+def wait_for_port(
+    host: str, port: int, timeout: float = 10.0, interval: float = 0.02
+) -> bool:
+    """Waits until a TCP connection to host:port succeeds or the timeout elapses."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with socket.create_connection((host, port), timeout=0.05):
+                return True
+        except OSError:
+            time.sleep(interval)
+    return False
+
+
 def poll_server_ready(url: str, retries: int = 10, delay: float = 0.5) -> bool:
     """Polls a URL until it's responsive or retries are exhausted."""
     logger = logging.getLogger("server_management")
@@ -78,8 +93,13 @@ class ServerManager:
         )
         self.process.start()
 
+        # Probe the socket on a tight interval first so startup costs ~tens of
+        # milliseconds instead of whole polling periods; the health check then
+        # only confirms the app is serving.
         health_check_url = f"{self.base_url}/_health"
-        if not poll_server_ready(health_check_url, retries=20, delay=0.5):
+        if not wait_for_port(self.host, self.port) or not poll_server_ready(
+            health_check_url, retries=20, delay=0.05
+        ):
             self.stop()
             raise RuntimeError(f"Server failed to start at {health_check_url}")
 
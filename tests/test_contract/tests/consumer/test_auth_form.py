@@ -68,7 +68,11 @@ async def test_consumer_registration_form_interaction(
         await page.locator("#email").fill(TEST_EMAIL)
         await page.locator("#password").fill(TEST_PASSWORD)
         await page.locator("#username").fill(TEST_USERNAME)
-        await page.locator("input[type='submit']").click()
-        await page.wait_for_timeout(NETWORK_TIMEOUT_MS)
+        async with page.expect_response(
+            lambda response: response.request.method == "POST"
+            and REGISTER_API_PATH in response.url,
+            timeout=NETWORK_TIMEOUT_MS,
+        ):
+            await page.locator("input[type='submit']").click()
 
     # Pact verification happens automatically on context exit.
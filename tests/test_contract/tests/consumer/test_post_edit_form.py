@@ -109,5 +109,9 @@ async def test_consumer_post_edit_form_interaction(origin_with_routes: str, page
         await page.locator("#cr-insurance").select_option(
             EDITED_CLIENT_REFERRAL_INSURANCE
         )
-        await page.locator("input[type='submit']").click()
-        await page.wait_for_timeout(NETWORK_TIMEOUT_MS)
+        async with page.expect_response(
+            lambda response: response.request.method == "PATCH"
+            and POST_EDIT_API_PATH in response.url,
+            timeout=NETWORK_TIMEOUT_MS,
+        ):
+            await page.locator("input[type='submit']").click()
@@ -157,5 +157,9 @@ async def test_consumer_post_create_form_interaction(
         await page.locator("#cr-insurance").select_option(
             TEST_CLIENT_REFERRAL_INSURANCE
         )
-        await page.locator("input[type='submit']").click()
-        await page.wait_for_timeout(NETWORK_TIMEOUT_MS)
+        async with page.expect_response(
+            lambda response: response.request.method == "POST"
+            and POSTS_API_PATH in response.url,
+            timeout=NETWORK_TIMEOUT_MS,
+        ):
+            await page.locator("input[type='submit']").click()
@@ -64,7 +64,11 @@ async def test_consumer_delete_button_click(origin_with_routes: str, page: Page)
     with pact:
         await page.goto(detail_page_url)
         await page.wait_for_selector("span.owner-actions button")
-        await page.locator("span.owner-actions button", has_text="Delete").click()
-        await page.wait_for_timeout(NETWORK_TIMEOUT_MS)
+        async with page.expect_response(
+            lambda response: response.request.method == "DELETE"
+            and POST_DELETE_API_PATH in response.url,
+            timeout=NETWORK_TIMEOUT_MS,
+        ):
+            await page.locator("span.owner-actions button", has_text="Delete").click()
 
     # Pact verification happens automatically on context exit.
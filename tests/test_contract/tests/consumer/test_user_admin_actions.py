@@ -82,7 +82,13 @@ async def test_consumer_deactivate_button_click(origin_with_routes: str, page: P
     with pact:
         await page.goto(detail_page_url)
         await page.wait_for_selector("span.admin-actions button")
-        await page.locator("span.admin-actions button", has_text="Deactivate").click()
-        await page.wait_for_timeout(NETWORK_TIMEOUT_MS)
+        async with page.expect_response(
+            lambda response: response.request.method == "PUT"
+            and USER_ACTIVATION_API_PATH in response.url,
+            timeout=NETWORK_TIMEOUT_MS,
+        ):
+            await page.locator(
+                "span.admin-actions button", has_text="Deactivate"
+            ).click()
 
     # Pact verification happens automatically on context exit.
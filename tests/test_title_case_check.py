@@ -10,6 +10,8 @@ the source of recurring friction during agent-driven doc edits.
 import textwrap
 from pathlib import Path
 
+import pytest
+
 from scripts.dev.title_case_check import TitleCaseChecker
 
 
@@ -120,3 +122,130 @@ def test_real_heading_outside_any_fence_is_still_checked(tmp_path):
     assert any(
         "Wrongly" in v["original"] for v in violations
     ), f"A real miscased heading must still be flagged, got: {violations}"
+
+
+def test_fix_file_does_not_rewrite_when_nothing_changes(tmp_path):
+    """A violation whose original text is no longer on its line must not
+    rewrite the file — unchanged files keep their mtime so editors and
+    watchers don't see a spurious change."""
+    file = _write_md(tmp_path, "# Already fine\n")
+    before = file.stat().st_mtime_ns
+
+    fixed = TitleCaseChecker().fix_file(
+        file,
+        [{"line": 1, "original": "Some Stale Title", "suggested": "Some stale title"}],
+    )
+
+    assert fixed is False
+    assert file.stat().st_mtime_ns == before
+
+
+def test_titleignore_is_read_once_per_directory(tmp_path, monkeypatch):
+    (tmp_path / ".titleignore").write_text("# comment\nskip.md\n", encoding="utf-8")
+    skipped = _write_md(tmp_path, "# Not Sentence Case\n")
+    skipped = skipped.rename(tmp_path / "skip.md")
+    checked = _write_md(tmp_path, "# Not Sentence Case\n")
+
+    reads = []
+    original_read_text = Path.read_text
+
+    def _counting_read_text(self, *args, **kwargs):
+        if self.name == ".titleignore":
+            reads.append(self)
+        return original_read_text(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "read_text", _counting_read_text)
+    checker = TitleCaseChecker(respect_gitignore=False)
+
+    assert checker.check_file(skipped) == []
+    assert len(checker.check_file(checked)) == 1
+    assert len(reads) == 1
+
+
+def test_nested_gitignore_applies_below_its_own_directory(tmp_path, monkeypatch):
+    (tmp_path / ".git").mkdir()
+    docs = tmp_path / "docs"
+    docs.mkdir()
+    (docs / ".gitignore").write_text("/draft.md\n", encoding="utf-8")
+    for path in (docs / "draft.md", docs / "guide.md", tmp_path / "draft.md"):
+        path.write_text("# Not Sentence Case\n", encoding="utf-8")
+
+    monkeypatch.chdir(tmp_path)
+    checker = TitleCaseChecker()
+
+    flagged = {str(v["file"]) for v in checker.check_directory(tmp_path)}
+    assert flagged == {str(docs / "guide.md"), str(tmp_path / "draft.md")}
+    assert checker.check_file(docs / "draft.md") == []
+
+
+def test_sentence_case_conversion_is_cached_per_title(monkeypatch):
+    checker = TitleCaseChecker(respect_gitignore=False)
+    calls = []
+    original = TitleCaseChecker.is_colon_pattern
+
+    def _counting_is_colon_pattern(self, text):
+        calls.append(text)
+        return original(self, text)
+
+    monkeypatch.setattr(
+        TitleCaseChecker, "is_colon_pattern", _counting_is_colon_pattern
+    )
+
+    assert not checker.is_sentence_case("Last Activity")
+    assert checker.convert_to_sentence_case("Last Activity") == "Last activity"
+    assert calls == ["Last Activity"]
+
+
+def test_leading_emoji_is_kept_and_the_title_after_it_is_checked():
+    checker = TitleCaseChecker(respect_gitignore=False)
+
+    assert checker.remove_leading_emojis("🚀✨ Getting Started") == "Getting Started"
+    assert checker.remove_leading_emojis("Getting Started") == "Getting Started"
+    assert (
+        checker.convert_to_sentence_case("🚀 Getting Started") == "🚀 Getting started"
+    )
+
+
+def test_style_and_script_blocks_are_skipped(tmp_path):
+    file = tmp_path / "page.html"
+    file.write_text(
+        textwrap.dedent("""
+            <style>
+              <h1>Inside Style Block</h1>
+            </style>
+            <script>
+              const html = "<h2>Inside Script Block</h2>";
+            </script>
+            <h1>Outside Any Block</h1>
+            """),
+        encoding="utf-8",
+    )
+
+    violations = TitleCaseChecker(respect_gitignore=False).check_file(file)
+
+    assert [v["original"] for v in violations] == ["Outside Any Block"]
+
+
+def test_process_pool_scan_matches_sequential_scan(tmp_path, monkeypatch):
+    for i in range(5):
+        _write_md(tmp_path, f"# Heading Number {i}\n").rename(tmp_path / f"{i}.md")
+    checker = TitleCaseChecker(respect_gitignore=False)
+    sequential = checker.check_directory(tmp_path)
+
+    monkeypatch.setattr(TitleCaseChecker, "PARALLEL_MIN_FILES", 1)
+    monkeypatch.setattr("os.cpu_count", lambda: 2)
+    parallel = checker.check_directory(tmp_path)
+
+    assert len(sequential) == 5
+    assert parallel == sequential
+
+
+def test_plain_sentence_case_titles_skip_conversion(monkeypatch):
+    checker = TitleCaseChecker(respect_gitignore=False)
+    monkeypatch.setattr(
+        checker, "convert_to_sentence_case", lambda text: pytest.fail(text)
+    )
+
+    assert checker.is_sentence_case("Create a new post")
+    assert not checker._is_plain_sentence_case("Using the api")
+    assert not checker._is_plain_sentence_case("Create A Post")